@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feed entry HTML cleaning
+
+Compares the lxml-based html_to_text() against the original
+BeautifulSoup cleaner on the fixture corpus, after checking that both
+produce identical output.
+
+Usage (from pipeline/):
+    python benchmarks/bench_clean_html.py [--rounds 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ingestion.html_text import html_to_text, html_to_text_bs4
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'feed_html.json'
+
+
+def run(func, corpus, rounds: int) -> float:
+    """Return entries/sec for func over the corpus"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in corpus:
+            func(html)
+    elapsed = time.perf_counter() - start
+    return (len(corpus) * rounds) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(FIXTURES, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    # Output must be identical before speed matters
+    mismatches = [i for i, html in enumerate(corpus)
+                  if html_to_text(html) != html_to_text_bs4(html)]
+    if mismatches:
+        print(f"✗ Output differs on fixtures: {mismatches}")
+        return 1
+    print(f"✓ Identical output on {len(corpus)} fixtures")
+
+    old_rate = run(html_to_text_bs4, corpus, args.rounds)
+    new_rate = run(html_to_text, corpus, args.rounds)
+
+    print(f"  BeautifulSoup: {old_rate:10.0f} entries/sec")
+    print(f"  lxml:          {new_rate:10.0f} entries/sec")
+    print(f"  Speedup:       {new_rate / old_rate:10.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
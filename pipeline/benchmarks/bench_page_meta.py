@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: article page metadata extraction
+
+Compares the single-pass lxml extract_page_meta() against the original
+BeautifulSoup strategies on the fixture pages, after checking that both
+extract identical metadata.
+
+Usage (from pipeline/):
+    python benchmarks/bench_page_meta.py [--rounds 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ingestion.page_meta import extract_page_meta, extract_page_meta_bs4
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'article_pages.json'
+
+
+def run(func, pages, rounds: int) -> float:
+    """Return pages/sec for func over the fixture pages"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url, html, complete in pages:
+            func(html, url, complete)
+    elapsed = time.perf_counter() - start
+    return (len(pages) * rounds) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(FIXTURES, 'r', encoding='utf-8') as f:
+        fixtures = json.load(f)
+
+    # Pages are fetched as bytes, in whatever encoding the site uses
+    pages = [(p['url'], p['html'].encode(p['encoding']), p['complete']) for p in fixtures]
+
+    # Metadata must be identical before speed matters
+    mismatches = [url for url, html, complete in pages
+                  if extract_page_meta(html, url, complete) != extract_page_meta_bs4(html, url, complete)]
+    if mismatches:
+        print(f"✗ Metadata differs on fixtures: {mismatches}")
+        return 1
+    print(f"✓ Identical metadata on {len(pages)} fixture pages")
+
+    old_rate = run(extract_page_meta_bs4, pages, args.rounds)
+    new_rate = run(extract_page_meta, pages, args.rounds)
+
+    print(f"  BeautifulSoup: {old_rate:10.0f} pages/sec")
+    print(f"  lxml XPath:    {new_rate:10.0f} pages/sec")
+    print(f"  Speedup:       {new_rate / old_rate:10.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
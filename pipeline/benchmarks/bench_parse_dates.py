@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feed date string parsing
+
+Compares the per-source learned-format DateParser against the original
+generic dateutil parse on the fixture corpus, after checking that both
+resolve every date to the same UTC instant.
+
+Usage (from pipeline/):
+    python benchmarks/bench_parse_dates.py [--rounds 50]
+"""
+
+import argparse
+import json
+import sys
+import time
+import warnings
+from pathlib import Path
+
+from dateutil import parser as dateutil_parser
+from dateutil.parser import UnknownTimezoneWarning
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ingestion.date_parser import TZINFOS, DateParser, to_utc
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'feed_dates.json'
+
+
+def parse_dateutil(corpus):
+    """Original path: a generic dateutil parse for every entry"""
+    # The old path silently dropped zone names like EST; don't let the
+    # warning about it dominate the timing
+    warnings.simplefilter('ignore', UnknownTimezoneWarning)
+    for dates in corpus.values():
+        for value in dates:
+            dateutil_parser.parse(value)
+
+
+def parse_learned(corpus):
+    """New path: one DateParser per run, formats learned per source"""
+    date_parser = DateParser()
+    for source_name, dates in corpus.items():
+        for value in dates:
+            date_parser.parse(value, source_name)
+
+
+def run(func, corpus, rounds: int) -> float:
+    """Return dates/sec for func over the corpus"""
+    total = sum(len(dates) for dates in corpus.values())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(corpus)
+    elapsed = time.perf_counter() - start
+    return (total * rounds) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    with open(FIXTURES, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    # Every date must land on the same instant before speed matters
+    date_parser = DateParser()
+    mismatches = []
+    for source_name, dates in corpus.items():
+        for value in dates:
+            expected = to_utc(dateutil_parser.parse(value, tzinfos=TZINFOS))
+            if date_parser.parse(value, source_name) != expected:
+                mismatches.append(f"{source_name}: {value}")
+    if mismatches:
+        print(f"✗ Parsed dates differ: {mismatches[:5]}")
+        return 1
+
+    total = sum(len(dates) for dates in corpus.values())
+    print(f"✓ Identical UTC instants for {total} dates from {len(corpus)} sources")
+    for source_name in corpus:
+        fmt = date_parser.learned_format(source_name) or 'dateutil fallback'
+        print(f"  {source_name:16} {fmt}")
+
+    old_rate = run(parse_dateutil, corpus, args.rounds)
+    new_rate = run(parse_learned, corpus, args.rounds)
+
+    print(f"  dateutil:       {old_rate:10.0f} dates/sec")
+    print(f"  learned format: {new_rate:10.0f} dates/sec")
+    print(f"  Speedup:        {new_rate / old_rate:10.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Source Circuit Breaker
+Stops polling sources that keep failing until a cool-down period has passed
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from .source_stats import SourceStats
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Per-source circuit breaker driven by persistent health stats
+
+    After failure_threshold consecutive failed polls a source's breaker
+    opens and the source is skipped for cooldown_hours. Once the cool-down
+    has passed, one trial poll is allowed: success closes the breaker,
+    another failure re-opens it with a doubled cool-down (capped at
+    max_cooldown_hours).
+    """
+
+    def __init__(self, stats: SourceStats, failure_threshold: int = 3,
+                 cooldown_hours: float = 6.0, max_cooldown_hours: float = 72.0):
+        """
+        Args:
+            stats: Per-source health statistics
+            failure_threshold: Consecutive failures before the breaker opens
+            cooldown_hours: Initial time to skip a tripped source
+            max_cooldown_hours: Upper bound for the doubling cool-down
+        """
+        self.stats = stats
+        self.failure_threshold = failure_threshold
+        self.cooldown_hours = cooldown_hours
+        self.max_cooldown_hours = max_cooldown_hours
+
+    def retry_at(self, source_name: str) -> Optional[datetime]:
+        """
+        When a tripped source may be polled again
+
+        Returns:
+            Trial poll time, or None if the breaker is closed
+        """
+        stats = self.stats.get(source_name)
+        if not stats:
+            return None
+
+        failures = stats.get('consecutive_failures', 0)
+        if failures < self.failure_threshold or not stats.get('last_failure'):
+            return None
+
+        extra = failures - self.failure_threshold
+        cooldown = min(self.max_cooldown_hours, self.cooldown_hours * (2 ** extra))
+        return datetime.fromisoformat(stats['last_failure']) + timedelta(hours=cooldown)
+
+    def is_open(self, source_name: str, now: Optional[datetime] = None) -> bool:
+        """Whether a source should be skipped this run"""
+        retry_at = self.retry_at(source_name)
+        return retry_at is not None and (now or datetime.now()) < retry_at
+
+    def tripped(self, now: Optional[datetime] = None) -> List[Tuple[str, int, datetime]]:
+        """
+        Sources whose breaker is currently open
+
+        Returns:
+            List of (source name, consecutive failures, retry time)
+        """
+        now = now or datetime.now()
+        tripped = []
+
+        for source_name in self.stats.source_names():
+            retry_at = self.retry_at(source_name)
+            if retry_at is not None and now < retry_at:
+                failures = self.stats.get(source_name).get('consecutive_failures', 0)
+                tripped.append((source_name, failures, retry_at))
+
+        return tripped
@@ -0,0 +1,137 @@
+"""
+Feed Date Parsing for TechPulse
+Learns each source's date format once and normalizes every date to aware UTC
+"""
+
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from dateutil import parser as dateutil_parser
+
+logger = logging.getLogger(__name__)
+
+# Learned "format" for ISO 8601 dates, parsed with datetime.fromisoformat
+# (far cheaper than strptime; sitemaps and Atom feeds use nothing else)
+ISO_8601 = 'iso8601'
+
+# Formats seen in the wild, most common first. %z accepts 'Z', '+0000'
+# and '+00:00'; zone names are matched literally because %Z would also
+# accept the machine's local zone and drop its offset. The strptime ISO
+# formats catch what an older fromisoformat rejects (e.g. a 'Z' suffix).
+CANDIDATE_FORMATS = (
+    ISO_8601,
+    '%a, %d %b %Y %H:%M:%S %z',      # RFC 822, numeric offset
+    '%a, %d %b %Y %H:%M:%S GMT',     # RFC 822, GMT
+    '%a, %d %b %Y %H:%M:%S UTC',
+    '%Y-%m-%dT%H:%M:%S%z',           # ISO 8601 / RFC 3339
+    '%Y-%m-%dT%H:%M:%S.%f%z',        # RFC 3339 with fractional seconds
+    '%d %b %Y %H:%M:%S %z',          # RFC 822 without weekday
+    '%a, %d %b %Y %H:%M %z',         # RFC 822 without seconds
+    '%Y-%m-%d %H:%M:%S%z',
+    '%Y-%m-%dT%H:%M:%S',             # ISO 8601, no offset (assumed UTC)
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d',
+)
+
+# Learned "format" for sources no candidate matches: go straight to dateutil
+DATEUTIL = 'dateutil'
+
+# Zone abbreviations dateutil can't resolve on its own (RFC 822 allows them)
+TZINFOS = {
+    'UT': 0, 'GMT': 0, 'UTC': 0, 'Z': 0,
+    'EST': -5 * 3600, 'EDT': -4 * 3600,
+    'CST': -6 * 3600, 'CDT': -5 * 3600,
+    'MST': -7 * 3600, 'MDT': -6 * 3600,
+    'PST': -8 * 3600, 'PDT': -7 * 3600,
+}
+
+
+def to_utc(value: datetime) -> datetime:
+    """Normalize a datetime to aware UTC (naive values are taken as UTC)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _parse_as(value: str, fmt: str) -> datetime:
+    """Parse with one candidate format (raises ValueError if it doesn't match)"""
+    if fmt == ISO_8601:
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, fmt)
+
+
+def utc_now() -> datetime:
+    """Current time as an aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
+class DateParser:
+    """
+    Date string parser with a per-source learned format
+
+    Feeds use one date format for every entry, so the first entry that
+    parses against CANDIDATE_FORMATS pins that format for its source and
+    later entries cost a single strptime (or fromisoformat) call. Strings
+    no candidate matches fall back to dateutil, and a source whose dates
+    never match is sent to dateutil directly from then on.
+    """
+
+    def __init__(self):
+        self._formats: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def learned_format(self, source_name: str) -> Optional[str]:
+        """Format memoized for a source (None if not learned yet)"""
+        return self._formats.get(source_name)
+
+    def parse(self, value: str, source_name: str = '') -> Optional[datetime]:
+        """
+        Parse a date string into an aware UTC datetime
+
+        Args:
+            value: Date string from a feed or page
+            source_name: Source the string came from (keys the learned format)
+
+        Returns:
+            Aware UTC datetime, or None if the string isn't a date
+        """
+        value = value.strip()
+        if not value:
+            return None
+
+        known = self._formats.get(source_name)
+        if known and known != DATEUTIL:
+            try:
+                return to_utc(_parse_as(value, known))
+            except ValueError:
+                pass
+
+        if known != DATEUTIL:
+            for fmt in CANDIDATE_FORMATS:
+                if fmt == known:
+                    continue
+                try:
+                    parsed = _parse_as(value, fmt)
+                except ValueError:
+                    continue
+                self._learn(source_name, fmt)
+                return to_utc(parsed)
+
+        try:
+            parsed = dateutil_parser.parse(value, tzinfos=TZINFOS)
+        except (ValueError, OverflowError):
+            return None
+
+        if known is None:
+            self._learn(source_name, DATEUTIL)
+        return to_utc(parsed)
+
+    def _learn(self, source_name: str, fmt: str):
+        """Memoize the format a source's dates come in"""
+        with self._lock:
+            previous = self._formats.get(source_name)
+            self._formats[source_name] = fmt
+        if previous:
+            logger.debug(f"Date format for {source_name} changed to {fmt!r}")
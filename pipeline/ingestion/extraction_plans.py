@@ -0,0 +1,105 @@
+"""
+Learned Extraction Plans for HTML Sources
+Remembers which metadata strategy works for each source and host across runs
+"""
+
+import logging
+import threading
+from typing import Optional, Sequence
+
+from .page_meta import STRATEGIES
+from .state import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest page in a plan's moving hit rate
+HIT_RATE_ALPHA = 0.3
+
+
+class ExtractionPlans:
+    """
+    Persistent per-source, per-host extraction strategy
+
+    A site renders every article page with the same template, so the
+    strategy that found the first article (JSON-LD, Open Graph or plain
+    HTML) almost always finds the next one. Pages from a planned host try
+    that strategy first. A plan whose moving hit rate falls below
+    relearn_below is replaced by whichever strategy wins next.
+    """
+
+    def __init__(self, state_file: str, relearn_below: float = 0.5, min_pages: int = 5):
+        """
+        Args:
+            state_file: Path to the JSON plans file
+            relearn_below: Hit rate under which a plan is re-learned
+            min_pages: Pages a plan is judged on before it can be re-learned
+        """
+        self.state_file = state_file
+        self.relearn_below = relearn_below
+        self.min_pages = min_pages
+        self._plans = load_json_state(state_file, {})
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def strategy(self, source_name: str, host: str) -> Optional[str]:
+        """Strategy planned for a source's pages on a host (None if not learned yet)"""
+        with self._lock:
+            plan = self._plans.get(source_name, {}).get(host)
+            return plan['strategy'] if plan else None
+
+    def order(self, source_name: str, host: str) -> Sequence[str]:
+        """Strategies to try for a page, planned one first"""
+        planned = self.strategy(source_name, host)
+        if not planned:
+            return STRATEGIES
+        return (planned,) + tuple(s for s in STRATEGIES if s != planned)
+
+    def record(self, source_name: str, host: str, winner: Optional[str]):
+        """
+        Record which strategy found a page's article
+
+        Args:
+            source_name: Source the page belongs to
+            host: Page host
+            winner: Winning strategy, or None if none found the article
+        """
+        with self._lock:
+            hosts = self._plans.setdefault(source_name, {})
+            plan = hosts.get(host)
+
+            if plan is None:
+                if winner:
+                    hosts[host] = {'strategy': winner, 'pages': 1, 'hit_rate': 1.0}
+                return
+
+            hit = winner == plan['strategy']
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+            plan['pages'] += 1
+            plan['hit_rate'] = round(HIT_RATE_ALPHA * float(hit) +
+                                     (1 - HIT_RATE_ALPHA) * plan['hit_rate'], 3)
+
+            if hit or plan['pages'] < self.min_pages or plan['hit_rate'] >= self.relearn_below:
+                return
+
+            logger.info(f"Re-learning extraction plan for {source_name} ({host}): "
+                        f"'{plan['strategy']}' hit rate {plan['hit_rate']:.0%}")
+            if winner:
+                hosts[host] = {'strategy': winner, 'pages': 1, 'hit_rate': 1.0}
+            else:
+                del hosts[host]
+
+    def save(self):
+        """Persist plans to disk"""
+        with self._lock:
+            save_json_state(self.state_file, self._plans)
+
+    def summary(self) -> str:
+        """Human-readable hit/miss summary for the run log"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0
+        return f"{self.hits} planned hits, {self.misses} misses ({rate:.0f}% hit rate)"
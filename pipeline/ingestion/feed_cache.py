@@ -0,0 +1,89 @@
+"""
+Conditional GET Cache for RSS Feeds
+Stores ETag/Last-Modified validators and the last parsed entries per feed URL
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from .state import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCache:
+    """
+    Persistent validator store keyed by feed URL
+
+    A 304 Not Modified response means the feed body is unchanged, so the
+    entries parsed on the previous run can be reused without downloading
+    or re-parsing anything.
+    """
+
+    def __init__(self, cache_file: str):
+        """
+        Args:
+            cache_file: Path to the JSON cache file
+        """
+        self.cache_file = cache_file
+        self._feeds = load_json_state(cache_file, {})
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers for a feed
+
+        Validators are only sent when cached entries exist to fall back on.
+        """
+        with self._lock:
+            cached = self._feeds.get(feed_url)
+
+        headers = {}
+        if not cached or cached.get('entries') is None:
+            return headers
+
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        return headers
+
+    def get_entries(self, feed_url: str) -> Optional[List[Dict]]:
+        """Return the entries parsed on the last full fetch, counting a hit"""
+        with self._lock:
+            cached = self._feeds.get(feed_url)
+            if not cached:
+                return None
+            self.hits += 1
+            return cached.get('entries') or []
+
+    def store(self, feed_url: str, etag: Optional[str],
+              last_modified: Optional[str], entries: List[Dict]):
+        """Record validators and parsed entries after a full fetch, counting a miss"""
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                # Server doesn't support conditional requests
+                self._feeds.pop(feed_url, None)
+                return
+
+            self._feeds[feed_url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'entries': entries
+            }
+
+    def save(self):
+        """Persist the cache to disk"""
+        with self._lock:
+            save_json_state(self.cache_file, self._feeds)
+
+    def summary(self) -> str:
+        """Human-readable hit/miss summary for the run log"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0
+        return f"{self.hits} hits, {self.misses} misses ({rate:.0f}% not modified)"
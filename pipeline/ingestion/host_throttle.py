@@ -0,0 +1,61 @@
+"""
+Per-Host Request Throttling for TechPulse
+Bounds concurrent requests and spaces out requests to the same host
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class HostThrottle:
+    """Limits simultaneous requests and enforces spacing per host"""
+
+    def __init__(self, per_host_limit: int = 1, min_interval: float = 1.0):
+        """
+        Args:
+            per_host_limit: Maximum simultaneous requests to a single host
+            min_interval: Minimum seconds between request starts to the same host
+        """
+        self.per_host_limit = max(1, per_host_limit)
+        self.min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        """Extract the host key used for throttling"""
+        return urlparse(url).netloc.lower()
+
+    @contextmanager
+    def slot(self, url: str):
+        """
+        Hold a request slot for the URL's host
+
+        Blocks until a per-host slot is free and the spacing interval
+        since the previous request to that host has elapsed.
+        """
+        host = self.host_for(url)
+
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._semaphores[host] = semaphore
+
+        semaphore.acquire()
+        try:
+            # Reserve the next start time for this host
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.min_interval
+
+            if start > now:
+                time.sleep(start - now)
+
+            yield
+        finally:
+            semaphore.release()
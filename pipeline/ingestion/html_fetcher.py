@@ -4,27 +4,148 @@ Fetches articles from sites without RSS feeds using sitemap + HTML scraping
 """
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+import heapq
 import logging
-import xml.etree.ElementTree as ET
-import json
 import re
+from .date_parser import DateParser, utc_now
+from .extraction_plans import ExtractionPlans
+from .host_throttle import HostThrottle
 from .rss_fetcher import Article
+from .http_client import HTTPClient
+from .page_fetcher import PageFetcher
+from .watermarks import EntryWatermarks
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# How deep sitemap index files are followed
+SITEMAP_MAX_DEPTH = 2
+
+# Stop reading a sitemap after this many consecutive out-of-window entries
+# that follow in-window ones, as long as every dated entry so far has come
+# newest first
+SITEMAP_OLD_ENTRY_STOP_RUN = 20
+
+# Sitemap child elements we read, in any namespace
+SITEMAP_FIELDS = ('{*}loc', '{*}lastmod', '{*}publication_date')
+
+
+def _local_name(tag: str) -> str:
+    """Element name without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _iter_sitemap_items(chunks: Iterable[bytes]) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """
+    Incrementally parse the <url> or <sitemap> items of a sitemap document
+    
+    Each item is discarded as soon as its fields are read, so memory
+    stays flat however many entries the sitemap lists.
+    
+    Args:
+        chunks: Raw sitemap bytes, in pieces
+        
+    Yields:
+        (item name, fields) with a 'loc' and, if present, 'lastmod' and
+        'publication_date' (from a news:news block)
+    """
+    # Items are matched by local name in C; namespaces vary between sites
+    parser = etree.XMLPullParser(
+        events=('end',), tag=('{*}url', '{*}sitemap'),
+        resolve_entities=False, no_network=True
+    )
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            fields = {}
+            for child in element.iter(*SITEMAP_FIELDS):
+                name = _local_name(child.tag)
+                if child.text and name not in fields:
+                    fields[name] = child.text.strip()
+            
+            # Drop the parsed item and the (already cleared) ones before it
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            
+            if fields.get('loc'):
+                yield _local_name(element.tag), fields
+    
+    parser.close()
+
+
+class _SitemapCandidates:
+    """
+    The newest max_articles in-window entries seen so far
+    
+    Dated entries are kept in a bounded heap, undated ones (in document
+    order) in a list capped at the same size, so memory doesn't grow with
+    the number of sitemap entries.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.matched = 0
+        self._dated = []
+        self._undated = []
+        self._seen = set()
+    
+    def add(self, url: str, published: Optional[datetime]):
+        if url in self._seen:
+            return
+        self._seen.add(url)
+        self.matched += 1
+        
+        if published is None:
+            if len(self._undated) < self.limit:
+                self._undated.append(url)
+            return
+        
+        heapq.heappush(self._dated, (published, -self.matched, url))
+        if len(self._dated) > self.limit:
+            _, _, dropped = heapq.heappop(self._dated)
+            self._seen.discard(dropped)
+    
+    @property
+    def undated_full(self) -> bool:
+        """Whether an undated sitemap already gave us all the URLs we'd use"""
+        return not self._dated and len(self._undated) >= self.limit
+    
+    def urls(self) -> List[str]:
+        """Dated entries newest first, then undated ones in document order"""
+        dated = [url for _, _, url in sorted(self._dated, reverse=True)]
+        return (dated + self._undated)[:self.limit]
+
 
 class HTMLArticleFetcher:
     """Fetches articles from HTML pages with sitemap support"""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, http_client: Optional[HTTPClient] = None,
+                 seen_urls: Optional[EntryWatermarks] = None,
+                 page_fetcher: Optional[PageFetcher] = None,
+                 plans: Optional[ExtractionPlans] = None):
+        """
+        Args:
+            timeout: Request timeout in seconds
+            http_client: Shared HTTP client (a private one is created if omitted)
+            seen_urls: Per-source record of already-scraped pages and their
+                metadata; listed pages found there aren't fetched again
+            page_fetcher: Shared head-first page fetcher (one is created if omitted)
+            plans: Learned per-source, per-host extraction strategies
+        """
         self.timeout = timeout
         self.user_agent = 'TechPulse/1.0 (https://jeffcoy.net; AI content curator)'
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': self.user_agent})
+        self.http = http_client or HTTPClient(timeout=timeout, user_agent=self.user_agent)
+        self.date_parser = DateParser()
+        self.seen_urls = seen_urls
+        self.pages = page_fetcher or PageFetcher(self.http)
+        self.plans = plans
         
     def fetch_from_sitemap(self, sitemap_url: str, url_pattern: str, 
                           source_name: str, category: str = "general",
@@ -43,224 +164,279 @@ class HTMLArticleFetcher:
         Returns:
             List of Article objects
         """
-        articles = []
-        cutoff_time = datetime.now() - timedelta(hours=lookback_hours)
+        source = {
+            'name': source_name,
+            'sitemap_url': sitemap_url,
+            'url_pattern': url_pattern,
+            'category': category
+        }
+        return self.fetch_all_sources([source], lookback_hours=lookback_hours,
+                                      max_articles=max_articles)
+    
+    def fetch_all_sources(self, sources: List[Dict], lookback_hours: int = 48,
+                          max_articles: int = 30, max_workers: int = 8,
+                          per_host_limit: int = 4, host_delay: float = 0.25) -> List[Article]:
+        """
+        Fetch articles from several HTML sources through one bounded worker pool
         
-        logger.info(f"Fetching sitemap: {source_name} ({sitemap_url})")
+        Sitemaps and article pages of every source share the pool, so run
+        time tracks the slowest pages instead of the sum of all pages.
+        Pages scraped on an earlier run come from the seen-URL store
+        instead. Articles come back in source order and, within a source,
+        in sitemap order.
         
-        try:
-            # Fetch sitemap
-            response = self.session.get(sitemap_url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Parse sitemap XML
-            root = ET.fromstring(response.content)
-            
-            # Handle both sitemap formats (with and without namespace)
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-            
-            # Try with namespace first
-            url_elements = root.findall('.//ns:url/ns:loc', namespace)
-            if not url_elements:
-                # Try without namespace
-                url_elements = root.findall('.//loc')
-            
-            # Extract URLs matching pattern
-            pattern = re.compile(url_pattern)
-            matching_urls = []
+        Args:
+            sources: HTML source dicts from sources.yaml
+            lookback_hours: Only keep articles from last N hours
+            max_articles: Maximum number of articles to scrape per source
+            max_workers: Concurrent requests across all sources
+            per_host_limit: Maximum simultaneous requests to the same host
+            host_delay: Minimum seconds between request starts to the same host
             
-            for url_elem in url_elements:
-                url = url_elem.text
-                if pattern.search(url):
-                    matching_urls.append(url)
+        Returns:
+            List of Article objects
+        """
+        cutoff_time = utc_now() - timedelta(hours=lookback_hours)
+        throttle = HostThrottle(per_host_limit=per_host_limit, min_interval=host_delay)
+        all_articles = []
+        
+        def list_source(source: Dict) -> Optional[List[str]]:
+            with throttle.slot(source['sitemap_url']):
+                return self._list_sitemap(source['sitemap_url'], source['url_pattern'],
+                                          source['name'], cutoff_time, max_articles)
+        
+        def scrape(url: str, source: Dict) -> Optional[Article]:
+            with throttle.slot(url):
+                return self._scrape_article(url, source['name'],
+                                            source.get('category', 'general'))
+        
+        workers = max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='html') as pool:
+            listings = list(pool.map(list_source, sources))
             
-            logger.info(f"Found {len(matching_urls)} potential articles in sitemap")
+            pending = [(source, urls, self._unseen(source['name'], urls), {})
+                       for source, urls in zip(sources, listings) if urls is not None]
             
-            # Limit to most recent articles
-            urls_to_scrape = matching_urls[:max_articles]
+            # Queue pages round-robin across sources, so workers waiting on
+            # one host's limit don't hold up every other host
+            longest = max((len(new_urls) for _, _, new_urls, _ in pending), default=0)
+            for position in range(longest):
+                for source, _, new_urls, futures in pending:
+                    if position < len(new_urls):
+                        url = new_urls[position]
+                        futures[url] = pool.submit(scrape, url, source)
             
-            # Fetch and parse each article
-            for i, url in enumerate(urls_to_scrape, 1):
-                try:
-                    article = self._scrape_article(url, source_name, category)
-                    if article:
-                        # Check if recent enough
-                        if article.published and article.published >= cutoff_time:
-                            articles.append(article)
-                            logger.debug(f"  [{i}/{len(urls_to_scrape)}] ✓ {article.title[:60]}")
-                        else:
-                            logger.debug(f"  [{i}/{len(urls_to_scrape)}] ✗ Too old: {article.title[:60]}")
-                except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
-                    continue
+            # Collecting each source's URLs in order keeps sitemap order
+            for source, urls, new_urls, futures in pending:
+                articles = self._collect_scraped(source['name'], urls, futures, cutoff_time)
+                logger.info(f"✓ Fetched {len(articles)} articles from {source['name']} "
+                            f"({len(new_urls)} new pages scraped)")
+                all_articles.extend(articles)
+        
+        if self.seen_urls:
+            self.seen_urls.prune(cutoff_time)
+            self.seen_urls.save()
+        
+        if self.plans:
+            logger.info(f"  Extraction plans: {self.plans.summary()}")
+            self.plans.save()
+        
+        return all_articles
+    
+    def _unseen(self, source_name: str, urls: List[str]) -> List[str]:
+        """Listed URLs not scraped on an earlier run"""
+        if not self.seen_urls:
+            return urls
+        seen = self.seen_urls.seen_ids(source_name)
+        return [url for url in urls if url not in seen]
+    
+    def _list_sitemap(self, sitemap_url: str, url_pattern: str, source_name: str,
+                      cutoff_time: datetime, max_articles: int) -> Optional[List[str]]:
+        """
+        Pick the article URLs worth scraping from a sitemap (or sitemap index)
+        
+        Entries dated (news:publication_date, else lastmod) before the
+        cutoff are dropped without fetching the page; lastmod is never
+        earlier than publication, so nothing recent is lost. Dated entries
+        come newest first, followed by undated ones in document order.
+        
+        Returns:
+            Up to max_articles URLs, or None if the sitemap failed
+        """
+        logger.info(f"Fetching sitemap: {source_name} ({sitemap_url})")
+        
+        try:
+            candidates = _SitemapCandidates(max_articles)
+            self._read_sitemap(sitemap_url, source_name, re.compile(url_pattern),
+                               cutoff_time, candidates)
             
-            logger.info(f"✓ Fetched {len(articles)} articles from {source_name}")
+            urls = candidates.urls()
+            logger.info(f"Found {candidates.matched} potential articles in sitemap, "
+                        f"scraping the newest {len(urls)}")
+            return urls
             
         except requests.RequestException as e:
             logger.error(f"✗ Failed to fetch sitemap {source_name}: {e}")
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             logger.error(f"✗ Failed to parse sitemap XML {source_name}: {e}")
         except Exception as e:
             logger.error(f"✗ Unexpected error fetching {source_name}: {e}")
         
-        return articles
-    
-    def _scrape_article(self, url: str, source_name: str, category: str) -> Optional[Article]:
-        """Scrape a single article page"""
-        
-        response = self.session.get(url, timeout=self.timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'lxml')
-        
-        # Strategy 1: Try to extract JSON-LD structured data
-        article = self._extract_from_jsonld(soup, url, source_name, category)
-        if article:
-            return article
-        
-        # Strategy 2: Try Open Graph meta tags
-        article = self._extract_from_opengraph(soup, url, source_name, category)
-        if article:
-            return article
-        
-        # Strategy 3: Try standard HTML elements
-        article = self._extract_from_html(soup, url, source_name, category)
-        if article:
-            return article
-        
-        logger.warning(f"Could not extract article data from {url}")
         return None
     
-    def _extract_from_jsonld(self, soup: BeautifulSoup, url: str, 
-                            source_name: str, category: str) -> Optional[Article]:
-        """Extract article data from JSON-LD structured data"""
+    def _read_sitemap(self, sitemap_url: str, source_name: str, pattern: re.Pattern,
+                      cutoff_time: datetime, candidates: _SitemapCandidates,
+                      depth: int = 0):
+        """
+        Stream a sitemap into candidates, following sitemap index children
         
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
+        Child sitemaps whose lastmod is before the cutoff can't list
+        anything recent and are not fetched. Reading stops early once a
+        sitemap seen to be newest first has moved past the lookback window,
+        or an undated one has listed enough URLs. A sitemap with any entry
+        newer than the one before it is read to the end, since recent
+        posts may still follow.
+        """
+        old_run = 0
+        found_recent = False
+        newest_first = True
+        previous_date = None
+        items = self.http.iter_content(sitemap_url, timeout=self.timeout)
         
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
+        try:
+            for item_name, fields in _iter_sitemap_items(items):
+                if item_name == 'sitemap':
+                    lastmod = self._sitemap_date(fields, source_name)
+                    if lastmod and lastmod < cutoff_time:
+                        continue
+                    if depth >= SITEMAP_MAX_DEPTH:
+                        logger.warning(f"Not following nested sitemap index {fields['loc']}")
+                        continue
+                    try:
+                        self._read_sitemap(fields['loc'], source_name, pattern,
+                                           cutoff_time, candidates, depth + 1)
+                    except (requests.RequestException, etree.XMLSyntaxError) as e:
+                        logger.warning(f"Skipping child sitemap {fields['loc']}: {e}")
+                    continue
                 
-                # Handle both single objects and arrays
-                if isinstance(data, list):
-                    data = data[0] if data else {}
+                if not pattern.search(fields['loc']):
+                    continue
                 
-                # Look for NewsArticle, BlogPosting, or Article types
-                if data.get('@type') in ['NewsArticle', 'BlogPosting', 'Article']:
-                    title = data.get('headline') or data.get('name')
-                    description = data.get('description')
-                    date_str = data.get('datePublished') or data.get('dateCreated')
-                    author = data.get('author', {})
-                    if isinstance(author, dict):
-                        author = author.get('name')
-                    elif isinstance(author, list) and author:
-                        author = author[0].get('name') if isinstance(author[0], dict) else str(author[0])
-                    
-                    published = None
-                    if date_str:
-                        try:
-                            from dateutil import parser
-                            published = parser.parse(date_str)
-                        except Exception:
-                            published = datetime.now()
-                    
-                    if title and description and len(description.split()) >= 3:
-                        return Article(
-                            title=title,
-                            url=url,
-                            published=published or datetime.now(),
-                            content=description,
-                            source=source_name,
-                            category=category,
-                            author=author
-                        )
-            except (json.JSONDecodeError, KeyError, AttributeError) as e:
-                logger.debug(f"Error parsing JSON-LD: {e}")
-                continue
-        
-        return None
+                published = self._sitemap_date(fields, source_name)
+                if published:
+                    if previous_date and published > previous_date:
+                        newest_first = False
+                    previous_date = published
+                
+                if published and published < cutoff_time:
+                    old_run += 1
+                    if (newest_first and found_recent
+                            and old_run >= SITEMAP_OLD_ENTRY_STOP_RUN):
+                        logger.debug(f"Stopped reading {sitemap_url} past the lookback window")
+                        break
+                    continue
+                
+                old_run = 0
+                found_recent = True
+                candidates.add(fields['loc'], published)
+                if candidates.undated_full:
+                    break
+        except etree.XMLSyntaxError as e:
+            # A cut-off sitemap still yields the entries read before the cut
+            if not candidates.matched:
+                raise
+            logger.warning(f"Sitemap {sitemap_url} ended early: {e}")
+        finally:
+            items.close()
     
-    def _extract_from_opengraph(self, soup: BeautifulSoup, url: str,
-                               source_name: str, category: str) -> Optional[Article]:
-        """Extract article data from Open Graph meta tags"""
-        
-        og_title = soup.find('meta', property='og:title')
-        og_description = soup.find('meta', property='og:description')
-        og_type = soup.find('meta', property='og:type')
+    def _sitemap_date(self, fields: Dict[str, str], source_name: str) -> Optional[datetime]:
+        """Publication date of a sitemap entry (news:publication_date, else lastmod)"""
+        date_str = fields.get('publication_date') or fields.get('lastmod')
+        if not date_str:
+            return None
+        return self.date_parser.parse(date_str, f"{source_name} sitemap")
+    
+    def _collect_scraped(self, source_name: str, urls: List[str],
+                         futures: Dict[str, Future], cutoff_time: datetime) -> List[Article]:
+        """
+        Wait for a source's page scrapes and keep recent articles, in sitemap order
         
-        # Also try article:published_time
-        og_published = soup.find('meta', property='article:published_time')
-        og_author = soup.find('meta', property='article:author')
+        URLs without a future were scraped on an earlier run and are rebuilt
+        from their stored metadata (a recording run points them at their
+        last recorded page, so replays can scrape them). New pages are
+        recorded in the seen-URL store, including ones that yielded no
+        article; pages that failed to download are not, so the next run
+        retries them.
+        """
+        articles = []
         
-        if og_title and og_description:
-            title = og_title.get('content', '')
-            description = og_description.get('content', '')
-            
-            published = datetime.now()
-            if og_published:
+        for i, url in enumerate(urls, 1):
+            if url not in futures:
+                _, stored = self.seen_urls.lookup(source_name, url)
+                article = Article.from_record(stored) if stored else None
+                self.http.reuse_recorded(url)
+            else:
                 try:
-                    from dateutil import parser
-                    published = parser.parse(og_published.get('content', ''))
-                except Exception:
-                    pass
-            
-            author = None
-            if og_author:
-                author = og_author.get('content')
+                    article = futures[url].result()
+                except Exception as e:
+                    logger.error(f"Error scraping {url}: {e}")
+                    continue
+                
+                if self.seen_urls:
+                    self.seen_urls.record(
+                        source_name, url,
+                        article.to_record() if article else None,
+                        published=article.published if article else None
+                    )
             
-            if title and description and len(description.split()) >= 3:
-                return Article(
-                    title=title,
-                    url=url,
-                    published=published,
-                    content=description,
-                    source=source_name,
-                    category=category,
-                    author=author
-                )
+            if article:
+                # Check if recent enough
+                if article.published and article.published >= cutoff_time:
+                    articles.append(article)
+                    logger.debug(f"  [{i}/{len(urls)}] ✓ {article.title[:60]}")
+                else:
+                    logger.debug(f"  [{i}/{len(urls)}] ✗ Too old: {article.title[:60]}")
         
-        return None
+        return articles
     
-    def _extract_from_html(self, soup: BeautifulSoup, url: str,
-                          source_name: str, category: str) -> Optional[Article]:
-        """Extract article data from standard HTML elements (fallback)"""
+    def _scrape_article(self, url: str, source_name: str, category: str) -> Optional[Article]:
+        """
+        Scrape a single article page
         
-        # Try to find title
-        title_elem = (
-            soup.find('h1') or 
-            soup.find('meta', {'name': 'title'}) or
-            soup.find('title')
-        )
+        Only the page head is read unless none of its metadata describes
+        the article; the extracted metadata stays in the page registry for
+        later stages. With learned plans, the strategy that works for the
+        source's pages on this host is tried first, and hosts whose
+        articles are only found by the plain-HTML strategy are fetched
+        whole right away.
+        """
+        if self.plans:
+            host = urlparse(url).netloc
+            strategies = self.plans.order(source_name, host)
+            meta = self.pages.page_meta(url, require='title', timeout=self.timeout,
+                                        strategies=strategies,
+                                        full_page=strategies[0] == 'html')
+            self.plans.record(source_name, host, meta.strategy)
+        else:
+            meta = self.pages.page_meta(url, require='title', timeout=self.timeout)
         
-        # Try to find description
-        desc_elem = (
-            soup.find('meta', {'name': 'description'}) or
-            soup.find('p', class_=re.compile(r'(description|excerpt|summary)', re.I))
-        )
+        if not meta.title:
+            logger.warning(f"Could not extract article data from {url}")
+            return None
         
-        if title_elem and desc_elem:
-            # Extract text
-            if hasattr(title_elem, 'get'):
-                title = title_elem.get('content', '')
-            else:
-                title = title_elem.get_text(strip=True)
-            
-            if hasattr(desc_elem, 'get'):
-                description = desc_elem.get('content', '')
-            else:
-                description = desc_elem.get_text(strip=True)
-            
-            if title and description and len(description.split()) >= 3:
-                return Article(
-                    title=title,
-                    url=url,
-                    published=datetime.now(),
-                    content=description,
-                    source=source_name,
-                    category=category
-                )
+        published = None
+        if meta.published:
+            published = self.date_parser.parse(meta.published, source_name)
         
-        return None
+        return Article(
+            title=meta.title,
+            url=url,
+            published=published or utc_now(),
+            content=meta.description,
+            source=source_name,
+            category=category,
+            author=meta.author
+        )
 
 
 # Example usage
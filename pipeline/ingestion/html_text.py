@@ -0,0 +1,87 @@
+"""
+Fast HTML-to-Text Cleaning for Feed Entries
+Strips tags, scripts and styles without building a BeautifulSoup tree
+"""
+
+import logging
+import re
+import threading
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Elements whose text never shows up in BeautifulSoup's get_text()
+_SKIPPED_ELEMENTS = ('script', 'style', 'template')
+
+# libxml2 drops anything after a closing </body> or </html>, while
+# BeautifulSoup keeps it, so full documents go through the fallback path
+_DOCUMENT_END = re.compile(r'</(?:body|html)\b', re.IGNORECASE)
+
+# lxml parsers aren't thread-safe, so each fetch thread keeps its own
+_local = threading.local()
+
+
+def html_parser() -> etree.HTMLParser:
+    """lxml HTML parser for the calling thread"""
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = etree.HTMLParser()
+    return parser
+
+
+def html_to_text(html_content: str) -> str:
+    """
+    Convert an HTML fragment to whitespace-normalized plain text
+
+    Produces the same output as BeautifulSoup's
+    get_text(separator=' ', strip=True) with scripts and styles removed,
+    but parses straight into a C-level lxml tree. Falls back to the
+    BeautifulSoup path for markup lxml handles differently.
+
+    Args:
+        html_content: HTML markup (usually a feed summary or content field)
+
+    Returns:
+        Plain text with collapsed whitespace
+    """
+    if not html_content or not html_content.strip():
+        return ''
+
+    if _DOCUMENT_END.search(html_content):
+        return html_to_text_bs4(html_content)
+
+    try:
+        root = etree.fromstring(html_content, html_parser())
+        if root is None:
+            return ''
+
+        # Empty skipped elements rather than removing them: their tails then
+        # stay separate strings instead of merging into the preceding text
+        for element in list(root.iter(*_SKIPPED_ELEMENTS)):
+            element.text = None
+            for child in list(element):
+                element.remove(child)
+
+        # itertext() skips comments and PIs but yields their tails
+        # separately, matching BeautifulSoup's string boundaries
+        return ' '.join(' '.join(root.itertext()).split())
+    except (etree.LxmlError, ValueError) as e:
+        logger.debug(f"Fast HTML cleaning failed, using BeautifulSoup: {e}")
+        return html_to_text_bs4(html_content)
+
+
+def html_to_text_bs4(html_content: str) -> str:
+    """Original BeautifulSoup cleaning path (fallback for malformed markup)"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_content, 'lxml')
+
+    # Remove script and style elements
+    for script in soup(['script', 'style']):
+        script.decompose()
+
+    # Get text
+    text = soup.get_text(separator=' ', strip=True)
+
+    # Clean up whitespace
+    return ' '.join(text.split())
@@ -0,0 +1,336 @@
+"""
+Shared HTTP Client for TechPulse
+One pooled, keep-alive session used by every fetcher in a pipeline run
+"""
+
+import logging
+from collections import namedtuple
+from typing import Dict, Iterator, Optional, Pattern, Tuple
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from .response_store import ResponseStore
+
+# Suppress SSL warnings (when using verify=False)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'TechPulse/1.0 (https://jeffcoy.net; AI content curator)'
+
+# Validators that could turn a response into a body-less 304
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+# Body of a streamed, size-capped download (bytes_read counts wire bytes,
+# before decompression)
+FetchResult = namedtuple('FetchResult', [
+    'url', 'status_code', 'headers', 'content', 'truncated', 'bytes_read'
+])
+
+# Bytes of the previous chunk kept when looking for a stop marker, so a
+# marker split across chunks is still found
+STOP_MARKER_OVERLAP = 64
+
+
+def _cut_body(content: bytes, max_bytes: Optional[int],
+              stop_at: Optional[Pattern[bytes]]) -> Tuple[bytes, bool]:
+    """
+    Apply fetch()'s size cap and stop marker to a body
+
+    Returns:
+        Tuple of (body, whether it was cut short)
+    """
+    cut = False
+    if max_bytes and len(content) >= max_bytes:
+        content, cut = content[:max_bytes], True
+    if stop_at:
+        match = stop_at.search(content)
+        if match and match.end() < len(content):
+            content, cut = content[:match.end()], True
+    return content, cut
+
+
+class HTTPClient:
+    """
+    Pooled HTTP client shared across RSS, HTML and image fetching
+
+    Connections are kept alive per host, so a host we already talked to
+    (e.g. an article page after its feed) skips the TCP+TLS handshake.
+    With a response store attached, every body is recorded, or in replay
+    mode served from a recorded run without any network access.
+    """
+
+    def __init__(self, timeout: int = 30, max_retries: int = 2,
+                 pool_hosts: int = 32, pool_per_host: int = 4,
+                 verify_ssl: bool = False, user_agent: str = DEFAULT_USER_AGENT,
+                 response_store: Optional[ResponseStore] = None):
+        """
+        Args:
+            timeout: Default request timeout in seconds
+            max_retries: Transport-level retries for failed connection attempts
+            pool_hosts: Number of per-host connection pools to keep
+            pool_per_host: Keep-alive connections kept open per host
+            verify_ssl: Verify TLS certificates (off by default, see system cert issues)
+            user_agent: Default User-Agent header
+            response_store: Store to record responses into (or replay them from)
+        """
+        self.timeout = timeout
+        self.response_store = response_store
+
+        # Only connection failures (refused connections, connect timeouts)
+        # are retried here; read timeouts and 429/5xx are retried by callers
+        # (with jittered backoff) so attempts don't multiply across layers.
+        # read=False re-raises read errors as they are, so callers see
+        # requests.ReadTimeout rather than a generic ConnectionError
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=False,
+            status=0,
+            backoff_factor=0.5,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_hosts,
+            pool_maxsize=pool_per_host,
+            max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.verify = verify_ssl
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            # requests decompresses these transparently
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
+    @classmethod
+    def from_config(cls, config: Dict,
+                    response_store: Optional[ResponseStore] = None) -> 'HTTPClient':
+        """Build a client from the 'http' section of config.yaml"""
+        return cls(
+            timeout=config.get('timeout', 30),
+            max_retries=config.get('max_retries', 2),
+            pool_hosts=config.get('pool_hosts', 32),
+            pool_per_host=config.get('pool_per_host', 4),
+            verify_ssl=config.get('verify_ssl', False),
+            response_store=response_store
+        )
+
+    @property
+    def replaying(self) -> bool:
+        """Whether responses come from a recorded run instead of the network"""
+        return self.response_store is not None and self.response_store.replay
+
+    def reuse_recorded(self, url: str):
+        """
+        Note that a URL's response came from a cache instead of the network
+
+        When recording, the run's manifest points the URL at its last
+        recorded body, so replaying the run (without the caches) works.
+        """
+        if self.response_store and not self.replaying:
+            if not self.response_store.reuse(url):
+                logger.debug(f"No recorded body to reuse for {url}")
+
+    def get(self, url: str, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        Issue a GET request over the shared session
+
+        Args:
+            url: URL to fetch
+            headers: Extra headers merged over the session defaults
+            timeout: Per-request timeout (defaults to the client timeout)
+
+        Returns:
+            requests.Response
+        """
+        if self.replaying:
+            return self._replay(url)[0]
+
+        response = self.session.get(
+            url,
+            headers=headers,
+            timeout=timeout or self.timeout,
+            **kwargs
+        )
+
+        # Streamed bodies are recorded by fetch() once they've been read
+        if self.response_store and not kwargs.get('stream'):
+            self.response_store.record(url, response.status_code, response.url,
+                                       response.headers, response.content)
+        return response
+
+    def fetch(self, url: str, headers: Optional[Dict] = None,
+              timeout: Optional[float] = None, max_bytes: Optional[int] = None,
+              stop_at: Optional[Pattern[bytes]] = None,
+              chunk_size: int = 64 * 1024) -> FetchResult:
+        """
+        Stream a response body, stopping once max_bytes have been read
+
+        The cap applies to decompressed bytes, so a huge or misbehaving
+        endpoint can never blow up memory. With stop_at, reading also
+        stops once the pattern has been seen and the body ends right after
+        it (e.g. at </head>). Error statuses raise requests.HTTPError;
+        other statuses (including 304) are returned.
+
+        Args:
+            url: URL to fetch
+            headers: Extra headers merged over the session defaults
+            timeout: Per-request timeout (defaults to the client timeout)
+            max_bytes: Maximum body bytes to keep (None = unlimited)
+            stop_at: Pattern marking the end of the part of the body we need
+            chunk_size: Streaming chunk size
+
+        Returns:
+            FetchResult with the (possibly truncated) body
+        """
+        if self.replaying:
+            response, truncated = self._replay(url)
+            response.raise_for_status()
+            content, cut = _cut_body(response.content, max_bytes, stop_at)
+            return FetchResult(
+                url=response.url,
+                status_code=response.status_code,
+                headers=response.headers,
+                content=content,
+                truncated=truncated or cut,
+                bytes_read=len(content)
+            )
+
+        if self.response_store and headers and not self.response_store.has_body(url):
+            # A 304 for a body the store never saw couldn't be replayed,
+            # so the first recorded fetch of a URL is unconditional
+            headers = {k: v for k, v in headers.items() if k not in CONDITIONAL_HEADERS}
+
+        response = self.get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+
+            chunks = []
+            size = 0
+            tail = b''
+            truncated = False
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                chunks.append(chunk)
+                size += len(chunk)
+                if max_bytes and size >= max_bytes:
+                    truncated = True
+                    break
+                if stop_at:
+                    if stop_at.search(tail + chunk):
+                        truncated = True
+                        break
+                    tail = chunk[-STOP_MARKER_OVERLAP:]
+
+            content, cut = _cut_body(b''.join(chunks), max_bytes, stop_at)
+            truncated = truncated or cut
+
+            if self.response_store:
+                self.response_store.record(url, response.status_code, response.url,
+                                           response.headers, content, truncated)
+
+            return FetchResult(
+                url=response.url,
+                status_code=response.status_code,
+                headers=response.headers,
+                content=content,
+                truncated=truncated,
+                bytes_read=response.raw.tell()
+            )
+        finally:
+            # Closing mid-body drops the connection instead of draining it
+            response.close()
+
+    def iter_content(self, url: str, headers: Optional[Dict] = None,
+                     timeout: Optional[float] = None,
+                     chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream a response body chunk by chunk, for incremental parsers
+
+        The request is made on first iteration and error statuses raise
+        requests.HTTPError. Close the generator (e.g. with
+        contextlib.closing) to stop early: the connection is dropped and,
+        when recording, the part that was read is stored as truncated. A
+        body that breaks off with a network error isn't recorded.
+
+        Args:
+            url: URL to fetch
+            headers: Extra headers merged over the session defaults
+            timeout: Per-request timeout (defaults to the client timeout)
+            chunk_size: Streaming chunk size
+
+        Yields:
+            Decompressed body chunks
+        """
+        if self.replaying:
+            entry = self.response_store.entry(url)
+            if entry is None:
+                raise requests.ConnectionError(
+                    f"{url} was not recorded in run {self.response_store.run_id}"
+                )
+            if entry['status'] >= 400:
+                raise requests.HTTPError(f"{entry['status']} Error for url: {url}")
+            with self.response_store.open_body(entry) as f:
+                for chunk in iter(lambda: f.read(chunk_size), b''):
+                    yield chunk
+            return
+
+        response = self.get(url, headers=headers, timeout=timeout, stream=True)
+        writer = None
+        complete = False
+        try:
+            response.raise_for_status()
+            if self.response_store:
+                writer = self.response_store.body_writer()
+
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if writer:
+                    writer.write(chunk)
+                yield chunk
+            complete = True
+        except requests.RequestException:
+            # The body broke off, so the run saw a failed request, not a
+            # truncated body: record nothing, like fetch()
+            if writer:
+                writer.discard()
+                writer = None
+            raise
+        finally:
+            response.close()
+            if writer:
+                writer.commit(url, response.status_code, response.url,
+                              response.headers, truncated=not complete)
+
+    def _replay(self, url: str) -> Tuple[requests.Response, bool]:
+        """
+        Rebuild a recorded response for the replayed run
+
+        Returns:
+            Tuple of (requests.Response, whether the recorded body was truncated)
+        """
+        recorded = self.response_store.lookup(url)
+        if recorded is None:
+            raise requests.ConnectionError(
+                f"{url} was not recorded in run {self.response_store.run_id}"
+            )
+
+        response = requests.Response()
+        response.status_code = recorded['status']
+        response.url = recorded['url']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = recorded['content']
+        return response, recorded['truncated']
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
@@ -0,0 +1,98 @@
+"""
+Persistent JSON Cache
+Keeps JSON values between runs, with a TTL and LRU eviction
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from .date_parser import utc_now
+from .state import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+
+class JSONCache:
+    """
+    JSON values keyed by string, kept for ttl_hours
+
+    The cache holds at most max_entries values and evicts the least
+    recently used ones first. It is saved to cache_file in LRU order;
+    without a cache_file, values are only kept for this run. Safe to
+    share between threads.
+    """
+
+    def __init__(self, cache_file: Optional[str], ttl_hours: float,
+                 max_entries: int):
+        """
+        Args:
+            cache_file: Path to the JSON cache file (None = keep values for this run only)
+            ttl_hours: How long a value is reused
+            max_entries: Values kept before the least recently used are evicted
+        """
+        self.cache_file = cache_file
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max_entries
+        # Saved least recently used first, so file order is LRU order
+        stored = load_json_state(cache_file, {}) if cache_file else {}
+        self._entries = OrderedDict(
+            (key, entry) for key, entry in stored.items()
+            if isinstance(entry, dict) and 'fetched' in entry and 'value' in entry
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for a key (None on a miss), counting a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not self._expired(entry):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry['value']
+
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        """Store a value, evicting the least recently used ones"""
+        with self._lock:
+            self._entries[key] = {'fetched': utc_now().isoformat(), 'value': value}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str):
+        """Drop a value get() returned but the caller couldn't use, counting a miss instead"""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.hits -= 1
+                self.misses += 1
+
+    def save(self):
+        """Drop expired values and persist the cache to disk"""
+        if not self.cache_file:
+            return
+
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if self._expired(entry)]
+            for key in expired:
+                del self._entries[key]
+            save_json_state(self.cache_file, self._entries)
+
+        if expired:
+            logger.debug(f"Dropped {len(expired)} expired entries from {self.cache_file}")
+
+    def summary(self) -> str:
+        """Human-readable hit/miss summary for the run log"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0
+        return f"{self.hits} hits, {self.misses} misses ({rate:.0f}% hit rate)"
+
+    def _expired(self, entry: dict) -> bool:
+        return datetime.fromisoformat(entry['fetched']) + self.ttl < utc_now()
@@ -0,0 +1,75 @@
+"""
+Persistent Page Metadata Cache
+Keeps extracted article page metadata between runs, with a TTL and LRU eviction
+"""
+
+import logging
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .json_cache import JSONCache
+from .page_meta import PageMeta
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = ('fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src')
+
+
+def normalize_page_url(url: str) -> str:
+    """
+    Cache key for a page URL
+
+    Scheme and host are lowercased; the fragment, utm_* and other
+    tracking parameters and a trailing slash are dropped, and the
+    remaining query parameters are sorted.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith('utm_') and k not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path,
+                       urlencode(query), ''))
+
+
+class PageCache(JSONCache):
+    """
+    Persistent article page metadata keyed by normalized URL
+
+    Pages rarely change once published, so the title, description, date,
+    author and image extracted from a page stay valid for ttl_hours. The
+    cache holds at most max_entries pages and evicts the least recently
+    used ones first.
+    """
+
+    def __init__(self, cache_file: str, ttl_hours: float = 168,
+                 max_entries: int = 5000):
+        """
+        Args:
+            cache_file: Path to the JSON cache file
+            ttl_hours: How long extracted metadata is reused
+            max_entries: Pages kept before the least recently used are evicted
+        """
+        super().__init__(cache_file, ttl_hours=ttl_hours, max_entries=max_entries)
+
+    def get(self, url: str) -> Optional[PageMeta]:
+        """Cached metadata for a page, counting a hit or miss"""
+        key = normalize_page_url(url)
+        fields = super().get(key)
+        if fields is None:
+            return None
+
+        try:
+            return PageMeta(url=url, **fields)
+        except TypeError:
+            # Written by a version with different fields
+            self.discard(key)
+            return None
+
+    def put(self, meta: PageMeta):
+        """Store a page's metadata, evicting the least recently used pages"""
+        fields = meta._asdict()
+        del fields['url']
+        super().put(normalize_page_url(meta.url), fields)
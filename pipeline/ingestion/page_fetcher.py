@@ -0,0 +1,211 @@
+"""
+Article Page Fetching for TechPulse
+Reads article pages head-first and extracts their metadata once per run
+"""
+
+import logging
+import re
+import threading
+from collections import namedtuple
+from contextlib import nullcontext
+from typing import Dict, Optional, Sequence
+
+from .host_throttle import HostThrottle
+from .http_client import HTTPClient
+from .page_cache import PageCache
+from .page_meta import STRATEGIES, PageMeta, extract_page_meta
+
+logger = logging.getLogger(__name__)
+
+# End of the document head; JSON-LD, Open Graph and twitter: tags live above it
+HEAD_END = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+# Read at most this much looking for </head> (inline styles can make heads large)
+DEFAULT_HEAD_MAX_BYTES = 256 * 1024
+
+# Small reads, so little of the body is downloaded past </head>
+HEAD_CHUNK_SIZE = 8 * 1024
+
+# Markup of an article page; partial is True when only a prefix was read
+Page = namedtuple('Page', ['url', 'content', 'partial'])
+
+
+class PageFetcher:
+    """
+    Article page fetcher shared by the HTML scraper and image extractor
+
+    fetch_head() stops reading at </head> (or head_max_bytes), which is
+    all metadata extraction needs on almost every site; the whole page is
+    only fetched when the head doesn't have what the caller needs.
+    page_meta() keeps every page's extracted metadata for the rest of the
+    run, so a page scraped at ingestion isn't fetched or parsed again for
+    its image, and with a PageCache attached, for later runs too. Bytes
+    read and bytes skipped are tallied for the run summary.
+    """
+
+    def __init__(self, http_client: HTTPClient,
+                 head_max_bytes: int = DEFAULT_HEAD_MAX_BYTES,
+                 page_cache: Optional[PageCache] = None):
+        """
+        Args:
+            http_client: Shared HTTP client
+            head_max_bytes: Byte limit for head-only reads (0 = always read whole pages)
+            page_cache: Metadata cache kept between runs
+        """
+        self.http = http_client
+        self.head_max_bytes = head_max_bytes
+        self.page_cache = page_cache
+        self._registry: Dict[str, PageMeta] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            'heads': 0,
+            'full': 0,
+            'reused': 0,
+            'bytes_read': 0,
+            'bytes_skipped': 0,
+            'unknown_length': 0
+        }
+
+    def page_meta(self, url: str, require: str, headers: Optional[Dict] = None,
+                  timeout: Optional[float] = None,
+                  strategies: Sequence[str] = STRATEGIES,
+                  full_page: bool = False,
+                  throttle: Optional[HostThrottle] = None) -> PageMeta:
+        """
+        Metadata for an article page, fetched at most once per run
+
+        The run's registry is checked first, then the page cache; only
+        pages in neither are fetched.
+
+        Args:
+            url: Page URL
+            require: PageMeta field the caller needs ('title' or 'image');
+                when the head doesn't have it, the whole page is read
+            headers: Extra request headers
+            timeout: Request timeout
+            strategies: Extraction strategies in the order to try them
+            full_page: Skip the head-only read (the metadata is known to
+                be in the body)
+            throttle: Per-host limits for the page's requests (pages
+                already known this run or cached don't wait on it)
+
+        Returns:
+            PageMeta (the required field may still be None)
+        """
+        with self._lock:
+            meta = self._registry.get(url)
+
+        if meta and (getattr(meta, require) or meta.complete):
+            with self._lock:
+                self._stats['reused'] += 1
+            return meta
+
+        if meta is None and self.page_cache:
+            meta = self.page_cache.get(url)
+            if meta and (getattr(meta, require) or meta.complete):
+                with self._lock:
+                    self._registry[url] = meta
+                # Replays don't use the cache, so they need the page recorded
+                self.http.reuse_recorded(url)
+                return meta
+
+        with throttle.slot(url) if throttle else nullcontext():
+            if meta is None and not full_page:
+                page = self.fetch_head(url, headers=headers, timeout=timeout)
+                meta = extract_page_meta(page.content, url, complete=not page.partial,
+                                         strategies=strategies)
+
+            if meta is None or (not getattr(meta, require) and not meta.complete):
+                page = self.fetch_full(url, headers=headers, timeout=timeout)
+                meta = extract_page_meta(page.content, url, strategies=strategies)
+
+        with self._lock:
+            self._registry[url] = meta
+        if self.page_cache:
+            self.page_cache.put(meta)
+        return meta
+
+    def remember(self, url: str, page: Page) -> PageMeta:
+        """
+        Keep the metadata of a whole page read for another purpose
+
+        The page is only parsed if the run doesn't already have complete
+        metadata for it, so later page_meta() calls need no request.
+
+        Args:
+            url: Page URL as requested
+            page: The page, read in full
+
+        Returns:
+            PageMeta for the page
+        """
+        with self._lock:
+            meta = self._registry.get(url)
+        if meta and meta.complete:
+            return meta
+
+        meta = extract_page_meta(page.content, url)
+        with self._lock:
+            self._registry[url] = meta
+        if self.page_cache:
+            self.page_cache.put(meta)
+        return meta
+
+    def fetch_head(self, url: str, headers: Optional[Dict] = None,
+                   timeout: Optional[float] = None) -> Page:
+        """
+        Fetch a page up to the end of its <head>
+
+        Args:
+            url: Page URL
+            headers: Extra request headers
+            timeout: Request timeout
+
+        Returns:
+            Page (partial when reading stopped before the end of the body)
+        """
+        if not self.head_max_bytes:
+            return self.fetch_full(url, headers=headers, timeout=timeout)
+
+        result = self.http.fetch(url, headers=headers, timeout=timeout,
+                                 max_bytes=self.head_max_bytes, stop_at=HEAD_END,
+                                 chunk_size=HEAD_CHUNK_SIZE)
+        self._count('heads', result)
+        return Page(url=result.url, content=result.content, partial=result.truncated)
+
+    def fetch_full(self, url: str, headers: Optional[Dict] = None,
+                   timeout: Optional[float] = None) -> Page:
+        """Fetch a whole page"""
+        result = self.http.fetch(url, headers=headers, timeout=timeout)
+        self._count('full', result)
+        return Page(url=result.url, content=result.content, partial=False)
+
+    def summary(self) -> str:
+        """One-line summary of page reads for the run log"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        message = (f"{stats['heads']} head-only reads, {stats['full']} full pages, "
+                   f"{stats['reused']} reused within the run; "
+                   f"read {stats['bytes_read'] / 1024:.0f} KB, "
+                   f"skipped {stats['bytes_skipped'] / 1024:.0f} KB")
+        if stats['unknown_length']:
+            message += f" (+{stats['unknown_length']} pages of unknown length)"
+        return message
+
+    def _count(self, kind: str, result):
+        """Tally one fetch; skipped bytes are only known from Content-Length"""
+        skipped = 0
+        unknown = 0
+        if result.truncated:
+            length = result.headers.get('Content-Length')
+            if length and length.isdigit():
+                skipped = max(0, int(length) - result.bytes_read)
+            else:
+                unknown = 1
+
+        with self._lock:
+            self._stats[kind] += 1
+            self._stats['bytes_read'] += result.bytes_read
+            self._stats['bytes_skipped'] += skipped
+            self._stats['unknown_length'] += unknown
@@ -0,0 +1,351 @@
+"""
+Article Page Metadata for TechPulse
+Extracts title, description, date, author and image from a page in one parse
+"""
+
+import codecs
+import json
+import logging
+import re
+from collections import namedtuple
+from typing import Dict, List, Optional, Sequence
+
+from bs4 import BeautifulSoup
+from bs4.dammit import EncodingDetector
+from lxml import etree
+
+from .html_text import html_parser
+
+logger = logging.getLogger(__name__)
+
+# JSON-LD types that describe an article
+ARTICLE_TYPES = ('NewsArticle', 'BlogPosting', 'Article')
+
+# Extraction strategies in their default order. 'html' reads the <h1>,
+# so it only runs on complete pages.
+STRATEGIES = ('jsonld', 'opengraph', 'html')
+
+# Every element any strategy looks at, collected in one XPath pass (a
+# union comes back in document order, like successive soup.find() calls)
+_METADATA_ELEMENTS = etree.XPath(
+    '//meta | //title | //h1 | //script[@type="application/ld+json"]'
+)
+
+# Meta tags the image lookup tries, in order
+_IMAGE_TAGS = (('property', 'og:image'), ('name', 'twitter:image'), ('property', 'article:image'))
+
+# Metadata read from an article page. title, description, published (the
+# raw date string) and author come from the first strategy that finds the
+# article, named in strategy; image is the raw og:image / twitter:image /
+# article:image URL. complete is False when only the page head was parsed.
+PageMeta = namedtuple('PageMeta', [
+    'url', 'title', 'description', 'published', 'author', 'image', 'complete',
+    'strategy'
+], defaults=(None,))
+
+
+def extract_page_meta(html: bytes, url: str, complete: bool = True,
+                      strategies: Sequence[str] = STRATEGIES) -> PageMeta:
+    """
+    Extract article metadata from page markup
+
+    Strategies are tried in order, by default JSON-LD structured data,
+    Open Graph tags, then standard HTML elements; the first that finds
+    the article wins. The HTML strategy needs the page body (it prefers
+    the <h1>), so it only runs on complete pages.
+
+    The page is parsed into a C-level lxml tree and a single XPath pass
+    collects the <meta>, <title>, <h1> and JSON-LD elements every
+    strategy needs, giving the same result as the BeautifulSoup path
+    without its repeated tree scans. Falls back to that path for markup
+    lxml can't parse.
+
+    Args:
+        html: Page markup, whole or just the head
+        url: Page URL
+        complete: Whether html is the whole page
+        strategies: Strategy names (see STRATEGIES) in the order to try them
+
+    Returns:
+        PageMeta (title is None if no strategy found the article)
+    """
+    try:
+        root = etree.fromstring(_decode(html), html_parser())
+    except (etree.LxmlError, ValueError) as e:
+        logger.debug(f"Fast metadata extraction failed, using BeautifulSoup: {e}")
+        return extract_page_meta_bs4(html, url, complete, strategies)
+
+    elements = _PageElements(root)
+    extractors = {
+        'jsonld': elements.from_jsonld,
+        'opengraph': elements.from_opengraph,
+        'html': elements.from_html
+    }
+    return _build_meta(url, complete, strategies, extractors, elements.meta_image())
+
+
+def _build_meta(url: str, complete: bool, strategies: Sequence[str],
+                extractors: Dict, image: Optional[str]) -> PageMeta:
+    """Run strategies in order and build PageMeta from the first that succeeds"""
+    fields = {}
+    winner = None
+    for name in strategies:
+        if name == 'html' and not complete:
+            continue
+        found = extractors[name]()
+        if found:
+            fields, winner = found, name
+            break
+
+    return PageMeta(
+        url=url,
+        title=fields.get('title'),
+        description=fields.get('description'),
+        published=fields.get('published'),
+        author=fields.get('author'),
+        image=image,
+        complete=complete,
+        strategy=winner
+    )
+
+
+def extract_page_meta_bs4(html: bytes, url: str, complete: bool = True,
+                          strategies: Sequence[str] = STRATEGIES) -> PageMeta:
+    """Original BeautifulSoup extraction path (fallback for markup lxml rejects)"""
+    soup = BeautifulSoup(html, 'lxml')
+    extractors = {
+        'jsonld': lambda: _from_jsonld(soup),
+        'opengraph': lambda: _from_opengraph(soup),
+        'html': lambda: _from_html(soup)
+    }
+    return _build_meta(url, complete, strategies, extractors, _meta_image(soup))
+
+
+def _decode(html: bytes) -> str:
+    """
+    Decode page bytes the way BeautifulSoup would
+
+    libxml2 assumes Latin-1 for pages without a charset declaration, so
+    the declared encoding is tried first, then UTF-8, then Windows-1252.
+    """
+    declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+    for encoding in (declared, 'utf-8'):
+        if not encoding:
+            continue
+        try:
+            codecs.lookup(encoding)
+            return html.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return html.decode('windows-1252', errors='replace')
+
+
+class _PageElements:
+    """Metadata elements of a parsed page, gathered in one pass"""
+
+    def __init__(self, root):
+        # First element per (attribute, value) pair, e.g. ('property', 'og:title')
+        self.meta: Dict = {}
+        self.jsonld: List[Optional[str]] = []
+        self.h1 = None
+        self.title = None
+
+        if root is None:
+            return
+
+        for element in _METADATA_ELEMENTS(root):
+            tag = element.tag
+            if tag == 'meta':
+                for attr in ('property', 'name'):
+                    value = element.get(attr)
+                    if value is not None:
+                        self.meta.setdefault((attr, value), element)
+            elif tag == 'script':
+                self.jsonld.append(element.text)
+            elif tag == 'h1':
+                if self.h1 is None:
+                    self.h1 = element
+            elif self.title is None:
+                self.title = element
+
+    def from_jsonld(self) -> Optional[Dict]:
+        """Article fields from JSON-LD structured data"""
+        for text in self.jsonld:
+            try:
+                fields = _jsonld_fields(json.loads(text))
+                if fields:
+                    return fields
+            except (json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
+                logger.debug(f"Error parsing JSON-LD: {e}")
+        return None
+
+    def from_opengraph(self) -> Optional[Dict]:
+        """Article fields from Open Graph meta tags"""
+        og_title = self.meta.get(('property', 'og:title'))
+        og_description = self.meta.get(('property', 'og:description'))
+        og_published = self.meta.get(('property', 'article:published_time'))
+        og_author = self.meta.get(('property', 'article:author'))
+
+        if og_title is not None and og_description is not None:
+            title = og_title.get('content', '')
+            description = og_description.get('content', '')
+
+            if _usable(title, description):
+                return {
+                    'title': title,
+                    'description': description,
+                    'published': og_published.get('content', '') if og_published is not None else None,
+                    'author': og_author.get('content') if og_author is not None else None
+                }
+
+        return None
+
+    def from_html(self) -> Optional[Dict]:
+        """Article fields from standard HTML elements (fallback)"""
+        title_elem = self.h1
+        if title_elem is None:
+            title_elem = self.meta.get(('name', 'title'))
+        if title_elem is None:
+            title_elem = self.title
+
+        # The original strategy reads content= from whichever element it
+        # found, so only a <meta name=description> can describe the page
+        desc_elem = self.meta.get(('name', 'description'))
+
+        if title_elem is not None and desc_elem is not None:
+            title = title_elem.get('content', '')
+            description = desc_elem.get('content', '')
+
+            if _usable(title, description):
+                return {'title': title, 'description': description}
+
+        return None
+
+    def meta_image(self) -> Optional[str]:
+        """Image declared in the page's meta tags (og:image, twitter:image, article:image)"""
+        for key in _IMAGE_TAGS:
+            tag = self.meta.get(key)
+            if tag is not None and tag.get('content'):
+                return tag.get('content')
+        return None
+
+
+def _usable(title: Optional[str], description: Optional[str]) -> bool:
+    """Whether a strategy found enough to build an article from"""
+    return bool(title and description and len(description.split()) >= 3)
+
+
+def _jsonld_fields(data) -> Optional[Dict]:
+    """Article fields from one parsed JSON-LD block"""
+
+    # Handle both single objects and arrays
+    if isinstance(data, list):
+        data = data[0] if data else {}
+
+    # Look for NewsArticle, BlogPosting, or Article types
+    if data.get('@type') in ARTICLE_TYPES:
+        title = data.get('headline') or data.get('name')
+        description = data.get('description')
+        date_str = data.get('datePublished') or data.get('dateCreated')
+        author = data.get('author', {})
+        if isinstance(author, dict):
+            author = author.get('name')
+        elif isinstance(author, list) and author:
+            author = author[0].get('name') if isinstance(author[0], dict) else str(author[0])
+
+        if _usable(title, description):
+            return {
+                'title': title,
+                'description': description,
+                'published': date_str if isinstance(date_str, str) else None,
+                'author': author
+            }
+
+    return None
+
+
+def _from_jsonld(soup: BeautifulSoup) -> Optional[Dict]:
+    """Article fields from JSON-LD structured data"""
+
+    json_ld_scripts = soup.find_all('script', type='application/ld+json')
+
+    for script in json_ld_scripts:
+        try:
+            fields = _jsonld_fields(json.loads(script.string))
+            if fields:
+                return fields
+        except (json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
+            logger.debug(f"Error parsing JSON-LD: {e}")
+            continue
+
+    return None
+
+
+def _from_opengraph(soup: BeautifulSoup) -> Optional[Dict]:
+    """Article fields from Open Graph meta tags"""
+
+    og_title = soup.find('meta', property='og:title')
+    og_description = soup.find('meta', property='og:description')
+
+    # Also try article:published_time
+    og_published = soup.find('meta', property='article:published_time')
+    og_author = soup.find('meta', property='article:author')
+
+    if og_title and og_description:
+        title = og_title.get('content', '')
+        description = og_description.get('content', '')
+
+        if _usable(title, description):
+            return {
+                'title': title,
+                'description': description,
+                'published': og_published.get('content', '') if og_published else None,
+                'author': og_author.get('content') if og_author else None
+            }
+
+    return None
+
+
+def _from_html(soup: BeautifulSoup) -> Optional[Dict]:
+    """Article fields from standard HTML elements (fallback)"""
+
+    # Try to find title
+    title_elem = (
+        soup.find('h1') or
+        soup.find('meta', {'name': 'title'}) or
+        soup.find('title')
+    )
+
+    # Try to find description
+    desc_elem = (
+        soup.find('meta', {'name': 'description'}) or
+        soup.find('p', class_=re.compile(r'(description|excerpt|summary)', re.I))
+    )
+
+    if title_elem and desc_elem:
+        # Extract text
+        if hasattr(title_elem, 'get'):
+            title = title_elem.get('content', '')
+        else:
+            title = title_elem.get_text(strip=True)
+
+        if hasattr(desc_elem, 'get'):
+            description = desc_elem.get('content', '')
+        else:
+            description = desc_elem.get_text(strip=True)
+
+        if _usable(title, description):
+            return {'title': title, 'description': description}
+
+    return None
+
+
+def _meta_image(soup: BeautifulSoup) -> Optional[str]:
+    """Image declared in the page's meta tags (og:image, twitter:image, article:image)"""
+    for attrs in ({'property': 'og:image'},
+                  {'name': 'twitter:image'},
+                  {'property': 'article:image'}):
+        tag = soup.find('meta', attrs=attrs)
+        if tag and tag.get('content'):
+            return tag['content']
+    return None
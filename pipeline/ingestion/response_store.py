@@ -0,0 +1,247 @@
+"""
+Raw Response Store for TechPulse
+Keeps every fetched body, compressed and content-addressed, so runs can be replayed offline
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .state import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping for replay (validators and content type)
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class ResponseStore:
+    """
+    Content-addressed, gzip-compressed store of raw HTTP response bodies
+
+    Bodies live under objects/ named by their SHA-256, so a feed or page
+    that hasn't changed since an earlier run costs no extra disk. Each run
+    writes a manifest under runs/ mapping every requested URL to its
+    status, headers and body hash; replaying a run serves those entries
+    instead of touching the network.
+    """
+
+    def __init__(self, store_dir: str, run_id: Optional[str] = None, replay: bool = False):
+        """
+        Args:
+            store_dir: Root directory of the store
+            run_id: Run to record into or replay (a new timestamped ID if omitted)
+            replay: Serve responses from the run's manifest instead of recording
+        """
+        self.store_dir = Path(store_dir)
+        self.run_id = run_id or datetime.now().strftime('%Y%m%d-%H%M%S')
+        self.replay = replay
+        self._lock = threading.Lock()
+
+        # Last successful body seen per URL, used to resolve 304 responses
+        # and cache hits (a 206 from a Range request is what its replay reads)
+        self._index = load_json_state(self.store_dir / 'index.json', {})
+
+        if replay:
+            manifest_path = self._manifest_path(self.run_id)
+            if not manifest_path.exists():
+                raise FileNotFoundError(
+                    f"No recorded run '{self.run_id}' in {self.store_dir} "
+                    f"(available: {', '.join(self.list_runs(store_dir)) or 'none'})"
+                )
+            self._manifest = load_json_state(manifest_path, {})
+        else:
+            self._manifest = {
+                'run_id': self.run_id,
+                'started': datetime.now().isoformat(),
+                'responses': {}
+            }
+
+    @staticmethod
+    def list_runs(store_dir: str) -> List[str]:
+        """IDs of all recorded runs, oldest first"""
+        runs_dir = Path(store_dir) / 'runs'
+        if not runs_dir.exists():
+            return []
+        return sorted(p.stem for p in runs_dir.glob('*.json'))
+
+    @property
+    def started(self) -> Optional[datetime]:
+        """When the recorded (or recording) run started"""
+        started = self._manifest.get('started')
+        return datetime.fromisoformat(started) if started else None
+
+    def has_body(self, url: str) -> bool:
+        """Whether a full body for this URL was recorded on any run"""
+        with self._lock:
+            return url in self._index
+
+    def record(self, url: str, status_code: int, final_url: str,
+               headers: Dict, content: bytes, truncated: bool = False):
+        """
+        Store a response body and add it to this run's manifest
+
+        A 304 Not Modified is recorded as the last full body seen for the
+        URL, so replays never depend on the conditional-GET cache.
+        """
+        with self._lock:
+            if status_code == 304 and url in self._index:
+                self._manifest['responses'][url] = self._index[url]
+                return
+
+        writer = self.body_writer()
+        writer.write(content)
+        writer.commit(url, status_code, final_url, headers, truncated)
+
+    def reuse(self, url: str) -> bool:
+        """
+        Add a URL served from a cache this run (not fetched) to the manifest
+
+        Like a 304, it is recorded as the last full body seen for the URL,
+        so a replay, which skips the caches, can still serve it.
+
+        Returns:
+            False if no body was ever recorded for the URL
+        """
+        with self._lock:
+            if url in self._manifest['responses']:
+                return True
+            entry = self._index.get(url)
+            if entry is None:
+                return False
+            self._manifest['responses'][url] = entry
+            return True
+
+    def body_writer(self) -> 'BodyWriter':
+        """Start recording a body that arrives in chunks"""
+        return BodyWriter(self)
+
+    def entry(self, url: str) -> Optional[Dict]:
+        """Recorded status, url, headers and truncated flag for a URL in the replayed run"""
+        with self._lock:
+            return self._manifest['responses'].get(url)
+
+    def open_body(self, entry: Dict):
+        """Open a recorded body for streaming reads (a binary file object)"""
+        return gzip.open(self._object_path(entry['sha256']), 'rb')
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """
+        Recorded response for a URL in the replayed run
+
+        Returns:
+            Dict with status, url, headers, truncated and content, or None
+        """
+        entry = self.entry(url)
+        if entry is None:
+            return None
+
+        with self.open_body(entry) as f:
+            content = f.read()
+        return dict(entry, content=content)
+
+    def save(self):
+        """Write this run's manifest and the URL index"""
+        if self.replay:
+            return
+        with self._lock:
+            save_json_state(self._manifest_path(self.run_id), self._manifest)
+            save_json_state(self.store_dir / 'index.json', self._index)
+        logger.info(f"  Recorded {len(self._manifest['responses'])} responses as run {self.run_id}")
+
+    def prune(self, keep_runs: int):
+        """
+        Drop all but the newest keep_runs manifests and any bodies only they referenced
+        """
+        runs = self.list_runs(self.store_dir)
+        stale = runs[:-keep_runs] if keep_runs > 0 else []
+        for run_id in stale:
+            self._manifest_path(run_id).unlink()
+
+        referenced = set()
+        for run_id in self.list_runs(self.store_dir):
+            manifest = load_json_state(self._manifest_path(run_id), {})
+            referenced.update(e['sha256'] for e in manifest.get('responses', {}).values())
+
+        removed = 0
+        for path in (self.store_dir / 'objects').glob('*/*.gz'):
+            if path.name[:-len('.gz')] not in referenced:
+                path.unlink()
+                removed += 1
+
+        with self._lock:
+            self._index = {url: e for url, e in self._index.items() if e['sha256'] in referenced}
+            save_json_state(self.store_dir / 'index.json', self._index)
+
+        if stale or removed:
+            logger.info(f"  Pruned {len(stale)} recorded runs and {removed} unreferenced bodies")
+
+    def _manifest_path(self, run_id: str) -> Path:
+        return self.store_dir / 'runs' / f'{run_id}.json'
+
+    def _object_path(self, digest: str) -> Path:
+        return self.store_dir / 'objects' / digest[:2] / f'{digest}.gz'
+
+    def _add_entry(self, url: str, status_code: int, final_url: str,
+                   headers: Dict, digest: str, truncated: bool):
+        """Point a URL at a stored body in this run's manifest"""
+        entry = {
+            'status': status_code,
+            'url': final_url,
+            'headers': {k: headers[k] for k in KEPT_HEADERS if k in headers},
+            'sha256': digest,
+            'truncated': truncated
+        }
+
+        with self._lock:
+            self._manifest['responses'][url] = entry
+            if status_code in (200, 206):
+                self._index[url] = entry
+
+
+class BodyWriter:
+    """
+    Streams one response body into the store
+
+    Chunks are compressed and hashed as they arrive, so recording a large
+    body never holds it in memory. The object is only named (by its hash)
+    on commit; identical bodies share one object.
+    """
+
+    def __init__(self, store: ResponseStore):
+        self.store = store
+        self._hash = hashlib.sha256()
+
+        objects_dir = store.store_dir / 'objects'
+        objects_dir.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = objects_dir / f'.{threading.get_ident()}-{id(self)}.tmp'
+        self._file = gzip.open(self._tmp_path, 'wb')
+
+    def write(self, chunk: bytes):
+        self._hash.update(chunk)
+        self._file.write(chunk)
+
+    def commit(self, url: str, status_code: int, final_url: str,
+               headers: Dict, truncated: bool = False):
+        """Store the body and add it to the run's manifest"""
+        self._file.close()
+        digest = self._hash.hexdigest()
+
+        path = self.store._object_path(digest)
+        if path.exists():
+            self._tmp_path.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_path, path)
+
+        self.store._add_entry(url, status_code, final_url, headers, digest, truncated)
+
+    def discard(self):
+        """Drop a body that won't be recorded (e.g. the request failed)"""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
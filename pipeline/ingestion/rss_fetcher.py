@@ -5,15 +5,25 @@ Fetches articles from RSS/Atom feeds with error handling and retry logic
 
 import feedparser
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
 import logging
 from urllib.parse import urlparse
 import time
-import urllib3
-
-# Suppress SSL warnings (when using verify=False)
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+import random
+import sys
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .circuit_breaker import CircuitBreaker
+from .date_parser import DateParser, to_utc, utc_now
+from .feed_cache import FeedCache
+from .host_throttle import HostThrottle
+from .html_text import html_to_text
+from .http_client import FetchResult, HTTPClient
+from .scheduler import PollScheduler
+from .source_stats import SourceStats
+from .watermarks import EntryWatermarks
 
 # Configure logging
 logging.basicConfig(
@@ -22,9 +32,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Longest excerpt any output format shows (hero subtitle)
+EXCERPT_WORDS = 50
+
+# Reading speed used for read-time estimates
+WORDS_PER_MINUTE = 200
+
+# Backoff between retries of transient fetch failures (seconds)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Parse workers start from a clean server process where supported (not forked)
+PARSE_START_METHOD = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                      else 'spawn')
+
+# Compact, cheaply-pickled result of the parse stage. Source and category
+# are known to the caller, so they aren't shipped back from workers.
+EntryRecord = namedtuple('EntryRecord', [
+    'title', 'url', 'published', 'content', 'author', 'image_url'
+])
+
+# items: list of (entry_id, seen, EntryRecord or None) in feed order
+ParsedFeed = namedtuple('ParsedFeed', ['items', 'bozo_error'])
+
 
 class Article:
-    """Represents a single article with normalized fields"""
+    """
+    Represents a single article with normalized fields
+    
+    Slotted, with everything derived from the content (word count, excerpt
+    words, read time) computed once whenever the content is set. Source
+    and category strings are interned since every article shares one of a
+    handful of values.
+    """
+    
+    __slots__ = (
+        'title', 'url', 'published', 'source', '_category', 'author',
+        'image_url', 'image_width', 'image_height', 'score', '_content',
+        'word_count', 'excerpt_words', 'read_time_minutes'
+    )
     
     def __init__(self, title: str, url: str, published: datetime, 
                  content: str, source: str, category: str = "general", 
@@ -33,11 +79,50 @@ class Article:
         self.url = url
         self.published = published
         self.content = content
-        self.source = source
+        self.source = sys.intern(source)
         self.category = category
         self.author = author
         self.image_url = image_url
+        self.image_width = None  # Set by the image probe for published articles
+        self.image_height = None
         self.score = None  # Will be set by scoring module
+    
+    @property
+    def content(self) -> str:
+        return self._content
+    
+    @content.setter
+    def content(self, content: str):
+        self._content = content
+        words = content.split() if content else []
+        self.word_count = len(words)
+        self.excerpt_words = tuple(words[:EXCERPT_WORDS])
+        self.read_time_minutes = max(1, round(self.word_count / WORDS_PER_MINUTE))
+    
+    @property
+    def category(self) -> str:
+        return self._category
+    
+    @category.setter
+    def category(self, category: str):
+        self._category = sys.intern(category)
+    
+    @property
+    def summary(self) -> str:
+        """First 300 characters of the content"""
+        return self._content[:300] if self._content else ""
+    
+    def excerpt(self, max_words: int = 30) -> str:
+        """Leading words of the content, with an ellipsis if truncated"""
+        if max_words <= EXCERPT_WORDS:
+            words = self.excerpt_words[:max_words]
+        else:
+            words = self._content.split()[:max_words] if self._content else []
+        
+        excerpt = ' '.join(words)
+        if self.word_count > max_words:
+            excerpt += '...'
+        return excerpt
         
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
@@ -49,9 +134,37 @@ class Article:
             'source': self.source,
             'category': self.category,
             'score': self.score,
-            'word_count': len(self.content.split()) if self.content else 0
+            'word_count': self.word_count
         }
     
+    def to_record(self) -> Dict:
+        """Convert to a compact dictionary for persistent caches"""
+        return {
+            'title': self.title,
+            'url': self.url,
+            'published': self.published.isoformat() if self.published else None,
+            'content': self.content,
+            'source': self.source,
+            'category': self.category,
+            'author': self.author,
+            'image_url': self.image_url
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict) -> 'Article':
+        """Rebuild an Article from a to_record() dictionary"""
+        published = record.get('published')
+        return cls(
+            title=record['title'],
+            url=record['url'],
+            published=to_utc(datetime.fromisoformat(published)) if published else None,
+            content=record.get('content', ''),
+            source=record['source'],
+            category=record.get('category', 'general'),
+            author=record.get('author'),
+            image_url=record.get('image_url')
+        )
+    
     def __repr__(self):
         return f"<Article: {self.title[:50]}... from {self.source}>"
 
@@ -59,14 +172,53 @@ class Article:
 class RSSFetcher:
     """Fetches articles from RSS/Atom feeds"""
     
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3,
+                 feed_cache: Optional[FeedCache] = None,
+                 http_client: Optional[HTTPClient] = None,
+                 watermarks: Optional[EntryWatermarks] = None,
+                 parse_workers: int = 0,
+                 max_feed_bytes: int = 5_000_000,
+                 source_stats: Optional[SourceStats] = None,
+                 scheduler: Optional[PollScheduler] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            timeout: Request timeout in seconds
+            max_retries: Retries for transient fetch failures (timeouts, 429, 5xx)
+            feed_cache: Conditional GET cache (ETag / Last-Modified)
+            http_client: Shared HTTP client (one is created on first use if omitted)
+            watermarks: Per-source record of already-processed entries
+            parse_workers: Processes for feedparser + HTML cleaning (0 = parse inline)
+            max_feed_bytes: Default download cap per feed (sources can override)
+            source_stats: Per-source yield/latency/failure statistics to update
+            scheduler: Adaptive scheduler deciding which sources are due this run
+            circuit_breaker: Skips sources that keep failing until their cool-down passes
+        """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.feed_cache = feed_cache
+        self.watermarks = watermarks
+        self.parse_workers = parse_workers
+        self.max_feed_bytes = max_feed_bytes
+        self.source_stats = source_stats
+        self.scheduler = scheduler
+        self.circuit_breaker = circuit_breaker
+        self._http = http_client
+        self._parse_pool = None
+        self.date_parser = DateParser()
         self.user_agent = 'TechPulse/1.0 (https://jeffcoy.net; AI content curator)'
+    
+    @property
+    def http(self) -> HTTPClient:
+        """Shared HTTP client, created lazily so parse workers never open one"""
+        if self._http is None:
+            self._http = HTTPClient(timeout=self.timeout)
+        return self._http
         
     def fetch_feed(self, feed_url: str, source_name: str, 
                    category: str = "general", 
-                   lookback_hours: int = 48) -> List[Article]:
+                   lookback_hours: int = 48,
+                   max_bytes: Optional[int] = None) -> List[Article]:
         """
         Fetch articles from a single RSS feed
         
@@ -75,49 +227,188 @@ class RSSFetcher:
             source_name: Human-readable source name
             category: Content category
             lookback_hours: Only fetch articles from last N hours
+            max_bytes: Download cap for this feed (defaults to max_feed_bytes)
             
         Returns:
             List of Article objects
         """
         articles = []
-        cutoff_time = datetime.now() - timedelta(hours=lookback_hours)
+        cutoff_time = utc_now() - timedelta(hours=lookback_hours)
+        started = time.monotonic()
+        ok = False
+        new_count = 0
         
         logger.info(f"Fetching feed: {source_name} ({feed_url})")
         
         try:
-            # Fetch with custom user agent
-            # Note: verify=False bypasses SSL cert verification (workaround for system cert issues)
+            # Fetch with custom user agent over the shared connection pool
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(feed_url, headers=headers, timeout=self.timeout, verify=False)
-            response.raise_for_status()
+            if self.feed_cache:
+                headers.update(self.feed_cache.conditional_headers(feed_url))
+            response = self._download(feed_url, headers, max_bytes or self.max_feed_bytes,
+                                      source_name)
             
-            # Parse the feed
-            feed = feedparser.parse(response.content)
+            # Not modified since last run: reuse the previously parsed entries
+            if response.status_code == 304 and self.feed_cache:
+                cached = self.feed_cache.get_entries(feed_url)
+                if cached is not None:
+                    articles = self._articles_from_cache(cached, cutoff_time)
+                    ok = True
+                    logger.info(f"✓ Not modified, reused {len(articles)} articles from {source_name}")
+                    return articles
             
-            if feed.bozo:
-                logger.warning(f"Feed {source_name} has parsing errors: {feed.bozo_exception}")
+            if response.truncated:
+                # Feeds list newest entries first, so the prefix still holds
+                # everything inside the lookback window
+                logger.warning(f"Feed {source_name} exceeded {len(response.content):,} bytes, "
+                               f"parsing truncated download")
             
-            # Process entries
-            for entry in feed.entries:
-                try:
-                    article = self._parse_entry(entry, source_name, category, cutoff_time)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.error(f"Error parsing entry from {source_name}: {e}")
-                    continue
+            # Parse the feed (in a worker process when a parse pool is running)
+            seen_ids = self.watermarks.seen_ids(source_name) if self.watermarks else frozenset()
+            parsed = self._parse_content(response.content, source_name, category,
+                                         cutoff_time, seen_ids)
+            
+            if parsed.bozo_error:
+                logger.warning(f"Feed {source_name} has parsing errors: {parsed.bozo_error}")
+            
+            articles, new_count = self._collect_articles(parsed, source_name, category, cutoff_time)
             
+            if self.feed_cache:
+                self.feed_cache.store(
+                    feed_url,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    entries=[a.to_record() for a in articles]
+                )
+            
+            ok = True
             logger.info(f"✓ Fetched {len(articles)} articles from {source_name}")
             
         except requests.RequestException as e:
             logger.error(f"✗ Failed to fetch {source_name}: {e}")
         except Exception as e:
             logger.error(f"✗ Unexpected error fetching {source_name}: {e}")
+        finally:
+            if self.source_stats:
+                self.source_stats.record_poll(
+                    source_name, ok=ok,
+                    latency=time.monotonic() - started,
+                    new_entries=new_count
+                )
+        
+        return articles
+    
+    def _download(self, feed_url: str, headers: Dict, max_bytes: int,
+                  source_name: str) -> FetchResult:
+        """
+        Download a feed, retrying transient failures with jittered exponential backoff
         
+        Read timeouts, broken response bodies, 429 and 5xx responses are
+        retried up to max_retries times. Refused connections and connect
+        timeouts are already retried by the HTTP client, so they aren't
+        retried again here, and other errors (e.g. 404) fail immediately.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self.http.fetch(
+                    feed_url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    max_bytes=max_bytes
+                )
+            except requests.RequestException as e:
+                if attempt >= self.max_retries or not self._is_transient(e):
+                    raise
+                
+                # Full jitter: sleep a random fraction of the capped exponential delay
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+                attempt += 1
+                logger.warning(f"  Retry {attempt}/{self.max_retries} for {source_name} "
+                               f"in {delay:.1f}s: {e}")
+                time.sleep(delay)
+    
+    @staticmethod
+    def _is_transient(error: requests.RequestException) -> bool:
+        """Whether a failed request is worth retrying (connection failures aren't: see _download)"""
+        if isinstance(error, (requests.ReadTimeout, requests.exceptions.ChunkedEncodingError)):
+            return True
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return response.status_code == 429 or response.status_code >= 500
+        return False
+    
+    def _parse_content(self, content: bytes, source_name: str, category: str,
+                       cutoff_time: datetime, seen_ids: frozenset) -> ParsedFeed:
+        """Run the CPU-bound parse stage, off the GIL when a parse pool is available"""
+        if self._parse_pool is not None:
+            future = self._parse_pool.submit(
+                parse_feed_content, content, source_name, category, cutoff_time, seen_ids
+            )
+            return future.result()
+        
+        return parse_feed_content(content, source_name, category, cutoff_time,
+                                  seen_ids, parser=self)
+    
+    def _collect_articles(self, parsed: ParsedFeed, source_name: str, category: str,
+                          cutoff_time: datetime) -> Tuple[List[Article], int]:
+        """
+        Turn parse-stage records into Articles, reusing stored ones for seen entries
+        
+        Returns:
+            Tuple of (articles, number of new articles not seen on earlier runs)
+        """
+        articles = []
+        new_count = 0
+        
+        for entry_id, seen, record in parsed.items:
+            if seen:
+                _, stored = self.watermarks.lookup(source_name, entry_id)
+                if stored:
+                    articles.extend(self._articles_from_cache([stored], cutoff_time))
+                continue
+            
+            article = None
+            if record:
+                article = Article(source=source_name, category=category, **record._asdict())
+                articles.append(article)
+                new_count += 1
+            
+            if self.watermarks and entry_id:
+                self.watermarks.record(
+                    source_name, entry_id,
+                    article.to_record() if article else None,
+                    published=article.published if article else None
+                )
+        
+        if self.watermarks:
+            seen_count = sum(1 for _, seen, _ in parsed.items if seen)
+            logger.debug(f"  {source_name}: {new_count} new articles, "
+                         f"{seen_count} entries already seen")
+        
+        return articles, new_count
+    
+    def _entry_id(self, entry) -> Optional[str]:
+        """Stable identifier for a feed entry (GUID, falling back to link)"""
+        return entry.get('id') or entry.get('link') or None
+    
+    def _articles_from_cache(self, records: List[Dict], 
+                             cutoff_time: datetime) -> List[Article]:
+        """Rebuild cached articles, dropping any that fell out of the lookback window"""
+        articles = []
+        for record in records:
+            try:
+                article = Article.from_record(record)
+                if article.published and article.published < cutoff_time:
+                    continue
+                articles.append(article)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.debug(f"Skipping unusable cached entry: {e}")
         return articles
     
     def _parse_entry(self, entry, source_name: str, category: str, 
-                     cutoff_time: datetime) -> Optional[Article]:
+                     cutoff_time: datetime,
+                     published: Optional[datetime] = None) -> Optional[Article]:
         """Parse a single feed entry into an Article"""
         
         # Extract title
@@ -130,8 +421,9 @@ class RSSFetcher:
         if not url:
             return None
         
-        # Extract published date
-        published = self._parse_date(entry)
+        # Extract published date (unless the caller already did)
+        if published is None:
+            published = self._parse_date(entry, source_name)
         
         # Skip old articles
         if published and published < cutoff_time:
@@ -161,40 +453,38 @@ class RSSFetcher:
             image_url=image_url
         )
     
-    def _parse_date(self, entry) -> Optional[datetime]:
-        """Parse publication date from various feed formats"""
+    def _parse_date(self, entry, source_name: str = '') -> Optional[datetime]:
+        """Parse publication date from various feed formats (as aware UTC)"""
         
-        # Try different date fields
+        # Try different date fields (feedparser's structs are already UTC)
         for date_field in ['published_parsed', 'updated_parsed', 'created_parsed']:
             if hasattr(entry, date_field):
                 time_struct = getattr(entry, date_field)
                 if time_struct:
                     try:
-                        return datetime(*time_struct[:6])
+                        return datetime(*time_struct[:6], tzinfo=timezone.utc)
                     except (ValueError, TypeError):
                         continue
         
-        # Fallback to string parsing
+        # Fallback to string parsing with the source's learned format
         for date_field in ['published', 'updated', 'created']:
             if hasattr(entry, date_field):
                 date_str = getattr(entry, date_field)
                 if date_str:
-                    try:
-                        from dateutil import parser
-                        return parser.parse(date_str)
-                    except Exception:
-                        continue
+                    published = self.date_parser.parse(date_str, source_name)
+                    if published:
+                        return published
         
         # Default to now if no date found
-        return datetime.now()
+        return utc_now()
     
     def _extract_content(self, entry) -> str:
         """
         Extract content from various feed content fields
         
         NOTE: RSS/Atom feeds typically provide summaries or excerpts (15-500 words),
-        not full article content. To get full articles, you'd need to fetch and 
-        scrape each article URL separately (not implemented here for reliability/speed).
+        not full article content. Full articles are only fetched later, for the
+        top candidates, by the opt-in full-text stage (processing/full_text.py).
         """
         
         # Try content field (Atom)
@@ -260,56 +550,215 @@ class RSSFetcher:
     def _clean_html(self, html_content: str) -> str:
         """Remove HTML tags and clean up text"""
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'lxml')
-            
-            # Remove script and style elements
-            for script in soup(['script', 'style']):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Clean up whitespace
-            text = ' '.join(text.split())
-            
-            return text
+            return html_to_text(html_content)
         except Exception as e:
             logger.warning(f"HTML cleaning failed: {e}")
             return html_content
     
     def fetch_all_sources(self, sources: List[Dict], 
-                          lookback_hours: int = 48) -> List[Article]:
+                          lookback_hours: int = 48,
+                          max_workers: int = 1,
+                          per_host_limit: int = 1,
+                          host_delay: float = 1.0) -> List[Article]:
         """
         Fetch articles from multiple sources
         
         Args:
             sources: List of source dicts with 'url', 'name', 'category'
             lookback_hours: Only fetch recent articles
+            max_workers: Concurrent fetches (1 = sequential, one source at a time)
+            per_host_limit: Max simultaneous requests to the same host
+            host_delay: Seconds between requests to the same host
             
         Returns:
-            Combined list of all articles
+            Combined list of all articles, in source order
         """
+        logger.info(f"Starting fetch from {len(sources)} sources...")
+        
+        due_sources = sources
+        if self.circuit_breaker:
+            due_sources = [s for s in due_sources if not self._breaker_open(s)]
+        if self.scheduler:
+            due_sources, _ = self.scheduler.split_due(due_sources)
+        
+        if self.parse_workers > 0 and due_sources:
+            # Workers start on the first submit(), from an rss fetch thread;
+            # forking a process with other threads mid-request can leave a
+            # child stuck on a copied lock, so they never fork from here
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context(PARSE_START_METHOD)
+            )
+        
+        try:
+            if max_workers <= 1:
+                results = self._fetch_sequential(due_sources, lookback_hours)
+            else:
+                results = self._fetch_concurrent(
+                    due_sources, lookback_hours, max_workers, per_host_limit, host_delay
+                )
+        finally:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+        
+        # Merge in source order; skipped sources are served from the watermark store
+        fetched = {source['name']: articles for source, articles in zip(due_sources, results)}
+        cutoff_time = utc_now() - timedelta(hours=lookback_hours)
         all_articles = []
+        for source in sources:
+            if source['name'] in fetched:
+                all_articles.extend(fetched[source['name']])
+            else:
+                if self.watermarks:
+                    stored = self.watermarks.stored_articles(source['name'])
+                    all_articles.extend(self._articles_from_cache(stored, cutoff_time))
+                # Replays poll every source, so they need the feed recorded
+                self.http.reuse_recorded(source['url'])
         
-        logger.info(f"Starting fetch from {len(sources)} sources...")
+        logger.info(f"✓ Total articles fetched: {len(all_articles)}")
+        
+        if self.feed_cache:
+            logger.info(f"  Feed cache: {self.feed_cache.summary()}")
+            self.feed_cache.save()
+        
+        if self.watermarks:
+            # The lookback window only acts as a safety net for forgetting entries
+            self.watermarks.prune(cutoff_time)
+            self.watermarks.save()
+        
+        if self.source_stats:
+            self.source_stats.save()
+        
+        return all_articles
+    
+    def _breaker_open(self, source: Dict) -> bool:
+        """Check (and log) whether a source's circuit breaker is open"""
+        if not self.circuit_breaker.is_open(source['name']):
+            return False
+        
+        retry_at = self.circuit_breaker.retry_at(source['name'])
+        logger.warning(f"  ⚡ Circuit open for {source['name']}, "
+                       f"skipping until {retry_at:%Y-%m-%d %H:%M}")
+        return True
+    
+    def _fetch_source(self, source: Dict, lookback_hours: int) -> List[Article]:
+        """Fetch a single source dict"""
+        return self.fetch_feed(
+            feed_url=source['url'],
+            source_name=source['name'],
+            category=source.get('category', 'general'),
+            lookback_hours=lookback_hours,
+            max_bytes=source.get('max_bytes')
+        )
+    
+    def _fetch_sequential(self, sources: List[Dict],
+                          lookback_hours: int) -> List[List[Article]]:
+        """Fetch sources one after another, returning one list per source"""
+        results = []
         
         for source in sources:
             # Add delay between requests to be respectful
             time.sleep(1)
-            
-            articles = self.fetch_feed(
-                feed_url=source['url'],
-                source_name=source['name'],
-                category=source.get('category', 'general'),
-                lookback_hours=lookback_hours
-            )
-            
-            all_articles.extend(articles)
+            results.append(self._fetch_source(source, lookback_hours))
         
-        logger.info(f"✓ Total articles fetched: {len(all_articles)}")
+        return results
+    
+    def _fetch_concurrent(self, sources: List[Dict], lookback_hours: int,
+                          max_workers: int, per_host_limit: int,
+                          host_delay: float) -> List[List[Article]]:
+        """
+        Fetch sources with a bounded thread pool, returning one list per source
         
-        return all_articles
+        Politeness is enforced per host rather than globally, so slow or
+        distant hosts no longer hold up the rest of the run. Results come
+        back in the original (priority-sorted) source order.
+        """
+        throttle = HostThrottle(per_host_limit=per_host_limit, min_interval=host_delay)
+        
+        def fetch_one(source: Dict) -> List[Article]:
+            with throttle.slot(source['url']):
+                return self._fetch_source(source, lookback_hours)
+        
+        workers = min(max_workers, len(sources)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rss') as pool:
+            # map() yields results in submission order regardless of completion order
+            return list(pool.map(fetch_one, sources))
+
+
+# Stop parsing a feed after this many consecutive entries past the cutoff
+OLD_ENTRY_STOP_RUN = 3
+
+_worker_parser = None
+
+
+def parse_feed_content(content: bytes, source_name: str, category: str,
+                       cutoff_time: datetime, seen_ids: frozenset,
+                       parser: Optional[RSSFetcher] = None) -> ParsedFeed:
+    """
+    Parse stage: feedparser plus per-entry cleaning and extraction
+    
+    Module-level so it can run in a ProcessPoolExecutor worker. Entries in
+    seen_ids are only reported back by ID, without any per-entry work.
+    
+    Args:
+        content: Raw feed bytes
+        source_name: Source name (for logging and Article construction)
+        category: Content category
+        cutoff_time: Skip entries published before this
+        seen_ids: Entry IDs already processed on earlier runs
+        parser: RSSFetcher whose entry helpers to use (a per-process one if omitted)
+        
+    Returns:
+        ParsedFeed with (entry_id, seen, EntryRecord or None) items in feed order
+    """
+    global _worker_parser
+    if parser is None:
+        if _worker_parser is None:
+            _worker_parser = RSSFetcher()
+        parser = _worker_parser
+    
+    feed = feedparser.parse(content)
+    items = []
+    consecutive_old = 0
+    
+    for entry in feed.entries:
+        try:
+            entry_id = parser._entry_id(entry)
+            if entry_id and entry_id in seen_ids:
+                items.append((entry_id, True, None))
+                continue
+            
+            # Feeds are newest-first: once several entries in a row fall
+            # before the cutoff, the rest of the feed is older still
+            published = parser._parse_date(entry, source_name)
+            if published and published < cutoff_time:
+                consecutive_old += 1
+                items.append((entry_id, False, None))
+                if consecutive_old >= OLD_ENTRY_STOP_RUN:
+                    break
+                continue
+            consecutive_old = 0
+            
+            article = parser._parse_entry(entry, source_name, category, cutoff_time,
+                                          published=published)
+            record = None
+            if article:
+                record = EntryRecord(
+                    title=article.title,
+                    url=article.url,
+                    published=article.published,
+                    content=article.content,
+                    author=article.author,
+                    image_url=article.image_url
+                )
+            items.append((entry_id, False, record))
+        except Exception as e:
+            logger.error(f"Error parsing entry from {source_name}: {e}")
+            continue
+    
+    bozo_error = str(feed.bozo_exception) if feed.bozo else None
+    return ParsedFeed(items=items, bozo_error=bozo_error)
 
 
 def load_sources_from_yaml(yaml_file: str) -> List[Dict]:
@@ -331,7 +780,7 @@ def load_sources_from_yaml(yaml_file: str) -> List[Dict]:
     return active_sources
 
 
-# Example usage
+# Example usage (from pipeline/: python -m ingestion.rss_fetcher)
 if __name__ == '__main__':
     # Test the fetcher
     import os
@@ -0,0 +1,93 @@
+"""
+Adaptive Polling Scheduler
+Decides which sources are due on a given run from their observed publish rates
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .source_stats import SourceStats
+
+logger = logging.getLogger(__name__)
+
+# Interval multipliers: high-priority sources are polled more eagerly
+PRIORITY_FACTORS = {'high': 0.5, 'medium': 1.0, 'low': 2.0}
+
+
+class PollScheduler:
+    """
+    Skips sources that are unlikely to have published since their last poll
+
+    A source's poll interval is the time it takes, at its observed publish
+    rate, to produce one new entry. That interval is scaled by priority and
+    recent failure rate, then clamped to [min_interval_hours,
+    max_interval_hours]. Sources without enough history are always polled.
+    """
+
+    def __init__(self, stats: SourceStats, min_interval_hours: float = 0.0,
+                 max_interval_hours: float = 24.0, warmup_polls: int = 3):
+        """
+        Args:
+            stats: Per-source polling statistics
+            min_interval_hours: Never wait less than this between polls
+            max_interval_hours: Never wait longer than this between polls
+            warmup_polls: Successful polls before a source can be skipped
+        """
+        self.stats = stats
+        self.min_interval_hours = min_interval_hours
+        self.max_interval_hours = max_interval_hours
+        self.warmup_polls = warmup_polls
+
+    def poll_interval(self, source: Dict) -> Optional[float]:
+        """
+        Hours to wait between polls of a source
+
+        Returns:
+            Interval in hours, or None if the source has too little history
+        """
+        stats = self.stats.get(source['name'])
+        if not stats or stats['polls'] < self.warmup_polls or stats['new_per_hour'] is None:
+            return None
+
+        rate = stats['new_per_hour']
+        interval = (1.0 / rate) if rate > 0 else self.max_interval_hours
+
+        interval *= PRIORITY_FACTORS.get(source.get('priority', 'low'), 1.0)
+        interval *= 1.0 + (stats['failure_rate'] or 0.0)
+
+        return max(self.min_interval_hours, min(self.max_interval_hours, interval))
+
+    def split_due(self, sources: List[Dict],
+                  now: Optional[datetime] = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Partition sources into those due for polling and those to skip
+
+        Args:
+            sources: Source dicts (order is preserved in both lists)
+            now: Current time (defaults to now)
+
+        Returns:
+            Tuple of (due sources, skipped sources)
+        """
+        now = now or datetime.now()
+        due, skipped = [], []
+
+        for source in sources:
+            interval = self.poll_interval(source)
+            stats = self.stats.get(source['name'])
+
+            if interval is None or not stats.get('last_polled'):
+                due.append(source)
+                continue
+
+            elapsed = (now - datetime.fromisoformat(stats['last_polled'])).total_seconds() / 3600
+            if elapsed >= interval:
+                due.append(source)
+            else:
+                skipped.append(source)
+                logger.info(f"  ⏭ Skipping {source['name']} "
+                            f"(next poll in {interval - elapsed:.1f}h)")
+
+        logger.info(f"Scheduler: polling {len(due)}/{len(sources)} sources")
+        return due, skipped
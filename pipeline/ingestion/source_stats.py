@@ -0,0 +1,100 @@
+"""
+Per-Source Polling Statistics and Health
+Tracks new-entry yield, latency and failures for each source across runs
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .state import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest observation in the moving averages
+EWMA_ALPHA = 0.3
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    """Exponentially weighted moving average update"""
+    if previous is None:
+        return value
+    return EWMA_ALPHA * value + (1 - EWMA_ALPHA) * previous
+
+
+class SourceStats:
+    """Persistent per-source statistics, updated after every poll"""
+
+    def __init__(self, state_file: str):
+        """
+        Args:
+            state_file: Path to the JSON stats file
+        """
+        self.state_file = state_file
+        self._sources = load_json_state(state_file, {})
+        self._lock = threading.Lock()
+
+    def get(self, source_name: str) -> Optional[Dict]:
+        """Return a copy of the stats for a source (None if never polled)"""
+        with self._lock:
+            stats = self._sources.get(source_name)
+            return dict(stats) if stats else None
+
+    def source_names(self) -> List[str]:
+        """Names of all sources with recorded stats"""
+        with self._lock:
+            return list(self._sources)
+
+    def record_poll(self, source_name: str, ok: bool, latency: float,
+                    new_entries: int = 0, now: Optional[datetime] = None):
+        """
+        Record the outcome of polling a source
+
+        Args:
+            source_name: Source that was polled
+            ok: Whether the fetch succeeded
+            latency: Seconds the fetch took
+            new_entries: Entries not seen on earlier runs
+            now: Poll time (defaults to now)
+        """
+        now = now or datetime.now()
+
+        with self._lock:
+            stats = self._sources.setdefault(source_name, {
+                'polls': 0,
+                'new_entries': 0,
+                'new_per_hour': None,
+                'mean_latency': None,
+                'failure_rate': None,
+                'last_polled': None,
+                'consecutive_failures': 0,
+                'last_success': None,
+                'last_failure': None
+            })
+
+            stats['polls'] += 1
+            stats['mean_latency'] = round(_ewma(stats['mean_latency'], latency), 3)
+            stats['failure_rate'] = round(_ewma(stats['failure_rate'], 0.0 if ok else 1.0), 3)
+
+            if not ok:
+                stats['consecutive_failures'] = stats.get('consecutive_failures', 0) + 1
+                stats['last_failure'] = now.isoformat()
+            else:
+                stats['consecutive_failures'] = 0
+                stats['last_success'] = now.isoformat()
+                stats['new_entries'] += new_entries
+
+                # Publish rate: new entries per hour since the previous poll
+                if stats['last_polled']:
+                    hours = (now - datetime.fromisoformat(stats['last_polled'])).total_seconds() / 3600
+                    if hours > 0:
+                        rate = new_entries / hours
+                        stats['new_per_hour'] = round(_ewma(stats['new_per_hour'], rate), 4)
+
+                stats['last_polled'] = now.isoformat()
+
+    def save(self):
+        """Persist stats to disk"""
+        with self._lock:
+            save_json_state(self.state_file, self._sources)
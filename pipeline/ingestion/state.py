@@ -0,0 +1,55 @@
+"""
+Persistent Pipeline State
+Small helpers for JSON state files kept between pipeline runs
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def load_json_state(path, default: Any) -> Any:
+    """
+    Load a JSON state file
+
+    Args:
+        path: Path to the state file
+        default: Value returned when the file is missing or unreadable
+
+    Returns:
+        Parsed JSON data or default
+    """
+    path = Path(path)
+    if not path.exists():
+        return default
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable state file {path}: {e}")
+        return default
+
+
+def save_json_state(path, data: Any):
+    """
+    Atomically write a JSON state file
+
+    Writes to a temporary file first so an interrupted run never leaves
+    a half-written state file behind.
+
+    Args:
+        path: Path to the state file
+        data: JSON-serializable data
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
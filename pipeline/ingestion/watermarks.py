@@ -0,0 +1,105 @@
+"""
+Per-Source Entry Watermarks
+Remembers which feed entries were already processed so only new ones pay
+for HTML cleaning, author and image extraction
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .date_parser import utc_now
+from .state import load_json_state, save_json_state
+
+logger = logging.getLogger(__name__)
+
+
+class EntryWatermarks:
+    """
+    Persistent per-source record of seen entries
+
+    For each source we keep every entry ID (GUID or link) still inside
+    the lookback window. Each seen entry stores the article record it
+    produced, or None if it was rejected, so a repeat sighting costs a
+    dictionary lookup. Entries are matched by ID alone, not by date, so
+    a backdated entry that shows up late is still processed.
+    """
+
+    def __init__(self, state_file: str):
+        """
+        Args:
+            state_file: Path to the JSON watermark file
+        """
+        self.state_file = state_file
+        self._sources = load_json_state(state_file, {})
+        self._lock = threading.Lock()
+
+    def lookup(self, source_name: str, entry_id: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Check whether an entry was processed on an earlier run
+
+        Returns:
+            Tuple of (seen, article record or None)
+        """
+        with self._lock:
+            source = self._sources.get(source_name)
+            if not source or entry_id not in source['entries']:
+                return False, None
+            return True, source['entries'][entry_id]['article']
+
+    def seen_ids(self, source_name: str) -> frozenset:
+        """All entry IDs remembered for a source"""
+        with self._lock:
+            source = self._sources.get(source_name)
+            return frozenset(source['entries']) if source else frozenset()
+
+    def stored_articles(self, source_name: str) -> List[Dict]:
+        """Article records remembered for a source (used when a poll is skipped)"""
+        with self._lock:
+            source = self._sources.get(source_name)
+            if not source:
+                return []
+            return [e['article'] for e in source['entries'].values() if e['article']]
+
+    def record(self, source_name: str, entry_id: str, article: Optional[Dict],
+               published: Optional[datetime] = None):
+        """
+        Remember an entry and the article record it produced
+
+        Args:
+            source_name: Source the entry came from
+            entry_id: Stable entry identifier (GUID or link)
+            article: Article.to_record() output, or None if rejected
+            published: Entry publish time (defaults to now for pruning)
+        """
+        timestamp = (published or utc_now()).isoformat()
+
+        with self._lock:
+            source = self._sources.setdefault(source_name, {'entries': {}})
+            source['entries'][entry_id] = {'ts': timestamp, 'article': article}
+
+    def prune(self, cutoff_time: datetime):
+        """
+        Forget entries older than the lookback window
+
+        Anything older than the cutoff is rejected by the date check
+        anyway, so there's no need to remember it.
+        """
+        cutoff = cutoff_time.isoformat()
+        removed = 0
+
+        with self._lock:
+            for source in self._sources.values():
+                stale = [eid for eid, e in source['entries'].items() if e['ts'] < cutoff]
+                for entry_id in stale:
+                    del source['entries'][entry_id]
+                removed += len(stale)
+
+        if removed:
+            logger.debug(f"Pruned {removed} watermark entries older than {cutoff}")
+
+    def save(self):
+        """Persist watermarks to disk"""
+        with self._lock:
+            save_json_state(self.state_file, self._sources)
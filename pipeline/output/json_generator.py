@@ -160,29 +160,33 @@ class ContentGenerator:
         """Format article for hero section"""
         return {
             "title": article.title,
-            "subtitle": self._generate_excerpt(article.content, max_words=50),
+            "subtitle": article.excerpt(max_words=50),
             "category": self._format_category_name(article.category),
             "url": article.url,
             "source": article.source,
             "author": getattr(article, 'author', None) or article.source,  # Use real author or source
-            "read_time": self._estimate_read_time(article.content),
+            "read_time": f"{article.read_time_minutes} min",
             "score": round(article.score, 1) if article.score else 8.0,
             "published": article.published.isoformat() if article.published else None,
-            "image_url": getattr(article, 'image_url', None)  # Add image URL
+            "image_url": getattr(article, 'image_url', None),  # Add image URL
+            "image_width": getattr(article, 'image_width', None),
+            "image_height": getattr(article, 'image_height', None)
         }
     
     def _format_headline_article(self, article) -> Dict:
         """Format article for headlines grid"""
         return {
             "title": article.title,
-            "excerpt": self._generate_excerpt(article.content, max_words=30),
+            "excerpt": article.excerpt(max_words=30),
             "category": self._format_category_name(article.category),
             "url": article.url,
             "source": article.source,
-            "read_time": self._estimate_read_time(article.content),
+            "read_time": f"{article.read_time_minutes} min",
             "published": article.published.isoformat() if article.published else None,
             "score": round(article.score, 1) if article.score else 8.0,
-            "image_url": getattr(article, 'image_url', None)
+            "image_url": getattr(article, 'image_url', None),
+            "image_width": getattr(article, 'image_width', None),
+            "image_height": getattr(article, 'image_height', None)
         }
     
     def _format_runnerup_article(self, article) -> Dict:
@@ -193,10 +197,12 @@ class ContentGenerator:
             "source": article.source,
             "author": getattr(article, 'author', None) or article.source,
             "category": self._format_category_name(article.category),
-            "read_time": self._estimate_read_time(article.content),
+            "read_time": f"{article.read_time_minutes} min",
             "published": article.published.isoformat() if article.published else None,
             "score": round(article.score, 1) if article.score else 7.0,
-            "image_url": getattr(article, 'image_url', None)
+            "image_url": getattr(article, 'image_url', None),
+            "image_width": getattr(article, 'image_width', None),
+            "image_height": getattr(article, 'image_height', None)
         }
     
     def _format_archive_article(self, article) -> Dict:
@@ -209,8 +215,10 @@ class ContentGenerator:
             "category": article.category,
             "published": article.published.isoformat() if article.published else None,
             "score": round(article.score, 1) if article.score else 8.0,
-            "word_count": len(article.content.split()) if article.content else 0,
-            "image_url": getattr(article, 'image_url', None)
+            "word_count": article.word_count,
+            "image_url": getattr(article, 'image_url', None),
+            "image_width": getattr(article, 'image_width', None),
+            "image_height": getattr(article, 'image_height', None)
         }
     
     def _find_video_content(self, articles: List) -> Dict:
@@ -285,30 +293,6 @@ class ContentGenerator:
         }
         return replacements.get(category, category.replace('_', ' ').title())
     
-    def _generate_excerpt(self, content: str, max_words: int = 30) -> str:
-        """Generate a clean excerpt from content"""
-        if not content:
-            return ""
-        
-        words = content.split()[:max_words]
-        excerpt = ' '.join(words)
-        
-        # Add ellipsis if truncated
-        if len(content.split()) > max_words:
-            excerpt += '...'
-        
-        return excerpt
-    
-    def _estimate_read_time(self, content: str) -> str:
-        """Estimate reading time (assumes 200 words per minute)"""
-        if not content:
-            return "1 min"
-        
-        word_count = len(content.split())
-        minutes = max(1, round(word_count / 200))
-        
-        return f"{minutes} min"
-    
     def _generate_article_id(self, article) -> str:
         """Generate a unique ID for an article"""
         if article.published:
@@ -115,9 +115,8 @@ class QualityFilter:
         
         for article in articles:
             # Check word count
-            word_count = len(article.content.split()) if article.content else 0
-            if word_count < self.min_word_count:
-                logger.debug(f"Too short ({word_count} words): {article.title[:50]}")
+            if article.word_count < self.min_word_count:
+                logger.debug(f"Too short ({article.word_count} words): {article.title[:50]}")
                 continue
             
             # Check for common spam patterns
@@ -0,0 +1,174 @@
+"""
+Full-Text Article Extraction
+Replaces feed summaries with the readable article text for the top candidates
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import yaml
+from readability import Document
+
+from ingestion.host_throttle import HostThrottle
+from ingestion.html_text import html_to_text
+from ingestion.json_cache import JSONCache
+from ingestion.page_cache import normalize_page_url
+from ingestion.page_fetcher import PageFetcher
+from ingestion.rss_fetcher import Article
+from scoring.signals import score_recency, score_source_trust
+
+logger = logging.getLogger(__name__)
+
+
+class TextCache(JSONCache):
+    """
+    Persistent extracted article text keyed by normalized URL
+    
+    Same TTL and least-recently-used eviction as the page metadata cache.
+    Pages where readability found no article are kept too (as empty
+    text), so they aren't downloaded again every run.
+    """
+    
+    def __init__(self, cache_file: str, ttl_hours: float = 720,
+                 max_entries: int = 1000):
+        """
+        Args:
+            cache_file: Path to the JSON cache file
+            ttl_hours: How long extracted text is reused
+            max_entries: Pages kept before the least recently used are evicted
+        """
+        super().__init__(cache_file, ttl_hours=ttl_hours, max_entries=max_entries)
+    
+    def get(self, url: str) -> Optional[str]:
+        """Cached text for a page (None on a miss), counting a hit or miss"""
+        return super().get(normalize_page_url(url))
+    
+    def put(self, url: str, text: str):
+        """Store a page's text, evicting the least recently used pages"""
+        super().put(normalize_page_url(url), text)
+
+
+class FullTextExtractor:
+    """
+    Fetches article pages and extracts their main text with readability
+    
+    Feeds only carry 15-500 word summaries, which is all the quality and
+    depth signals see. Downloading and parsing every page would make the
+    run as slow as its slowest site, so candidates are first pre-ranked
+    on signals that cost nothing (source weight and recency, as the scorer
+    computes them) and only the top_n get their full text, through a
+    bounded worker pool with per-host limits.
+    """
+    
+    def __init__(self, page_fetcher: PageFetcher, text_cache: Optional[TextCache] = None,
+                 top_n: int = 60, max_workers: int = 4, per_host_limit: int = 2,
+                 host_delay: float = 0.25, timeout: float = 15,
+                 profile_path: str = None):
+        """
+        Args:
+            page_fetcher: Shared article page fetcher
+            text_cache: Extracted text kept between runs
+            top_n: Pre-ranked candidates that get their full text
+            max_workers: Concurrent page fetches
+            per_host_limit: Maximum simultaneous fetches from one site
+            host_delay: Minimum seconds between fetches from the same site
+            timeout: Request timeout per page
+            profile_path: Path to taste_profile.yaml (source weights)
+        """
+        self.pages = page_fetcher
+        self.text_cache = text_cache
+        self.top_n = top_n
+        self.max_workers = max_workers
+        self.throttle = HostThrottle(per_host_limit=per_host_limit, min_interval=host_delay)
+        self.timeout = timeout
+        self.user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) TechPulse/1.0'
+        
+        if profile_path is None:
+            profile_path = Path(__file__).parent.parent / 'scoring' / 'taste_profile.yaml'
+        try:
+            with open(profile_path, 'r') as f:
+                self.source_weights = (yaml.safe_load(f) or {}).get('source_weights', {})
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning(f"Could not load source weights, pre-ranking by recency only: {e}")
+            self.source_weights = {}
+    
+    def add_full_text(self, articles: List[Article]) -> List[Article]:
+        """
+        Replace the summaries of the top pre-ranked articles with full text
+        
+        An article keeps its feed content when the page can't be fetched
+        or the extracted text isn't longer than what the feed provided.
+        
+        Args:
+            articles: List of Article objects
+        
+        Returns:
+            The same articles, in the same order
+        """
+        candidates = sorted(articles, key=self._prerank_score, reverse=True)[:self.top_n]
+        logger.info(f"Extracting full text for top {len(candidates)} of {len(articles)} articles...")
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers),
+                                thread_name_prefix='fulltext') as pool:
+            texts = list(pool.map(self._extract_text, [a.url for a in candidates]))
+        
+        expanded = 0
+        for article, text in zip(candidates, texts):
+            if text and len(text.split()) > article.word_count:
+                article.content = text
+                expanded += 1
+        
+        logger.info(f"✓ Full text for {expanded}/{len(candidates)} articles")
+        if self.text_cache:
+            logger.info(f"  Text cache: {self.text_cache.summary()}")
+        
+        return articles
+    
+    def _extract_text(self, url: str) -> Optional[str]:
+        """
+        Readable main text of an article page
+        
+        Args:
+            url: Article URL
+        
+        Returns:
+            Plain text ('' if readability found no article), or None if
+            the page couldn't be fetched
+        """
+        if not url:
+            return None
+        
+        if self.text_cache:
+            text = self.text_cache.get(url)
+            if text is not None:
+                # Replays don't use the cache, so they need the page recorded
+                self.pages.http.reuse_recorded(url)
+                return text
+        
+        try:
+            headers = {'User-Agent': self.user_agent}
+            with self.throttle.slot(url):
+                page = self.pages.fetch_full(url, headers=headers, timeout=self.timeout)
+        except Exception as e:
+            logger.debug(f"Error fetching full text from {url}: {e}")
+            return None
+        
+        # The page is in hand, so the image extractor won't need to read it again
+        self.pages.remember(url, page)
+        
+        try:
+            text = html_to_text(Document(page.content, url=url).summary(html_partial=True))
+        except Exception as e:
+            logger.debug(f"Readability failed for {url}: {e}")
+            text = ''
+        
+        if self.text_cache:
+            self.text_cache.put(url, text)
+        return text
+    
+    def _prerank_score(self, article: Article) -> float:
+        """Cheap relevance estimate: the scorer's source trust plus recency, each 0-1"""
+        return (score_source_trust(article.source or '', self.source_weights)
+                + score_recency(article.published))
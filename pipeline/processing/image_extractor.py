@@ -5,10 +5,16 @@ Extracts featured images from article content and RSS feeds
 """
 
 import logging
-from typing import Optional, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, Tuple
 from bs4 import BeautifulSoup
-import requests
 from urllib.parse import urljoin, urlparse
+from ingestion.host_throttle import HostThrottle
+from ingestion.http_client import HTTPClient
+from ingestion.page_fetcher import PageFetcher
+from ingestion.rss_fetcher import Article
+from processing.image_probe import NOT_AN_IMAGE, ImageInfo, ImageProbe
 
 # Configure logging
 logging.basicConfig(
@@ -23,11 +29,25 @@ class ImageExtractor:
     Extracts featured images from articles
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[HTTPClient] = None,
+                 page_fetcher: Optional[PageFetcher] = None,
+                 image_probe: Optional[ImageProbe] = None):
+        """
+        Args:
+            http_client: Shared HTTP client
+            page_fetcher: Shared article page fetcher
+            image_probe: Reads image headers for real type and dimensions
+                (None = judge images by their URL and markup only)
+        """
         self.timeout = 10
         self.user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) TechPulse/1.0'
+        self.http = http_client or HTTPClient(timeout=self.timeout)
+        self.pages = page_fetcher or PageFetcher(self.http)
+        self.probe = image_probe
     
-    def extract_image(self, article: Dict) -> Optional[str]:
+    def extract_image(self, article: Article,
+                      throttle: Optional[HostThrottle] = None,
+                      timeout: Optional[float] = None) -> Optional[str]:
         """
         Extract featured image URL from article
         
@@ -36,88 +56,112 @@ class ImageExtractor:
         2. Open Graph image from URL
         3. First substantial image in content
         
+        With an image probe, a candidate the probe finds isn't an image
+        (or is gone) is passed over for the next one.
+        
         Args:
-            article: Article dictionary
+            article: Article to find an image for
+            throttle: Per-host limits for page requests
+            timeout: Request timeout (None = the extractor's default)
             
         Returns:
             Image URL or None
         """
+        return self._find_image(article, throttle, timeout)[0]
+    
+    def _find_image(self, article: Article,
+                    throttle: Optional[HostThrottle] = None,
+                    timeout: Optional[float] = None) -> Tuple[Optional[str], Optional[ImageInfo]]:
+        """
+        Featured image of an article and what the probe read from it
+        
+        Returns:
+            Tuple of (image URL or None, ImageInfo or None if there's no
+            probe or it couldn't read the image this time)
+        """
         # Check if RSS feed already has an image
-        if article.get('image_url'):
-            return article['image_url']
+        if article.image_url:
+            info = self._probe(article.image_url, throttle, timeout)
+            if info != NOT_AN_IMAGE:
+                return article.image_url, info
+            logger.debug(f"Feed image isn't an image: {article.image_url}")
         
         # Try to extract from article URL
-        url = article.get('url')
+        url = article.url
         if not url:
-            return None
+            return None, None
         
         try:
             # Get Open Graph image
-            og_image = self._get_og_image(url)
+            og_image = self._get_og_image(url, throttle, timeout)
             if og_image:
-                return og_image
+                info = self._probe(og_image, throttle, timeout)
+                if info != NOT_AN_IMAGE:
+                    return og_image, info
+                logger.debug(f"Open Graph image isn't an image: {og_image}")
             
             # Try to find image in content
-            if article.get('content'):
-                content_image = self._extract_from_content(article['content'], url)
-                if content_image:
-                    return content_image
+            if article.content:
+                return self._extract_from_content(article.content, url, timeout)
             
         except Exception as e:
             logger.debug(f"Error extracting image from {url}: {e}")
         
-        return None
+        return None, None
+    
+    def _probe(self, url: str, throttle: Optional[HostThrottle] = None,
+               timeout: Optional[float] = None) -> Optional[ImageInfo]:
+        """Probe result for an image URL (None without a probe)"""
+        if not self.probe:
+            return None
+        return self.probe.probe(url, throttle, timeout)
     
-    def _get_og_image(self, url: str) -> Optional[str]:
+    def _get_og_image(self, url: str,
+                      throttle: Optional[HostThrottle] = None,
+                      timeout: Optional[float] = None) -> Optional[str]:
         """
         Extract Open Graph image from URL
         
+        Pages already read this run (e.g. scraped HTML sources) come from
+        the page registry; others are read only as far as their head
+        unless the image tags aren't in it.
+        
         Args:
             url: Article URL
+            throttle: Per-host limits for page requests
+            timeout: Request timeout (None = the extractor's default)
             
         Returns:
             Image URL or None
         """
         try:
             headers = {'User-Agent': self.user_agent}
-            response = requests.get(url, headers=headers, timeout=self.timeout, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Try Open Graph image
-            og_image = soup.find('meta', property='og:image')
-            if og_image and og_image.get('content'):
-                img_url = og_image['content']
-                return self._normalize_url(img_url, url)
-            
-            # Try Twitter card image
-            twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-            if twitter_image and twitter_image.get('content'):
-                img_url = twitter_image['content']
-                return self._normalize_url(img_url, url)
-            
-            # Try article:image
-            article_image = soup.find('meta', property='article:image')
-            if article_image and article_image.get('content'):
-                img_url = article_image['content']
-                return self._normalize_url(img_url, url)
+            meta = self.pages.page_meta(url, require='image', headers=headers,
+                                        timeout=timeout or self.timeout, throttle=throttle)
+            if meta.image:
+                return self._normalize_url(meta.image, url)
             
         except Exception as e:
             logger.debug(f"Error fetching OG image: {e}")
         
         return None
     
-    def _extract_from_content(self, content: str, base_url: str) -> Optional[str]:
+    def _extract_from_content(self, content: str, base_url: str,
+                              timeout: Optional[float] = None
+                              ) -> Tuple[Optional[str], Optional[ImageInfo]]:
         """
         Extract first substantial image from HTML content
         
+        With an image probe, the probe decides whether a candidate is an
+        image; its URL is only judged when the probe couldn't read it.
+        
         Args:
             content: HTML content
             base_url: Base URL for relative links
+            timeout: Timeout for image probes (None = the probe's default)
             
         Returns:
-            Image URL or None
+            Tuple of (image URL or None, ImageInfo from the probe or None)
         """
         try:
             soup = BeautifulSoup(content, 'html.parser')
@@ -147,13 +191,23 @@ class ImageExtractor:
                 
                 # Normalize URL
                 img_url = self._normalize_url(src, base_url)
-                if self._is_valid_image_url(img_url):
-                    return img_url
+                info = self._probe(img_url, timeout=timeout)
+                if info == NOT_AN_IMAGE:
+                    continue
+                if info is None and not self._is_valid_image_url(img_url):
+                    continue
+                
+                # Without size attributes, the image's own header tells
+                if info and not (width and height) and info.width and info.height:
+                    if info.width < 200 or info.height < 200:
+                        continue
+                
+                return img_url, info
             
         except Exception as e:
             logger.debug(f"Error extracting from content: {e}")
         
-        return None
+        return None, None
     
     def _normalize_url(self, url: str, base_url: str) -> str:
         """
@@ -201,38 +255,102 @@ class ImageExtractor:
         
         return False
     
-    def add_images_to_articles(self, articles: list) -> list:
+    def add_images_to_articles(self, articles: list, max_workers: int = 1,
+                               per_host_limit: int = 2, host_delay: float = 0.25,
+                               deadline: Optional[float] = None) -> list:
         """
         Add image URLs to articles that don't have them
         
+        Pages are looked up through a bounded worker pool with per-host
+        limits. With an image probe, every article's image (found or from
+        the feed) also gets its real dimensions, and a feed image that
+        isn't an image is replaced or dropped. When deadline seconds
+        have passed, articles still waiting for their page go through
+        without an image rather than holding up the output.
+        
+        The call returns at the deadline without waiting for lookups still
+        in flight. Their results are dropped, but their worker threads
+        keep using the HTTP client until their requests end, and the
+        interpreter waits for them at exit. Each lookup's requests are
+        therefore only given the time left before the deadline when it
+        started (up to the usual timeout), so those threads finish soon
+        after it.
+        
         Args:
-            articles: List of article dictionaries
+            articles: List of Article objects
+            max_workers: Concurrent page lookups (1 = one at a time)
+            per_host_limit: Maximum simultaneous requests to the same host
+            host_delay: Minimum seconds between request starts to the same host
+            deadline: Seconds the whole phase may take (None = no limit)
             
         Returns:
-            Articles with image_url added
+            Articles with image_url (and image_width/image_height) set where found
         """
         logger.info(f"Extracting images for {len(articles)} articles...")
         
+        pending = [article for article in articles
+                   if not article.image_url or (self.probe and article.image_width is None)]
+        throttle = HostThrottle(per_host_limit=per_host_limit, min_interval=host_delay)
+        stop_at = time.monotonic() + deadline if deadline else None
+        
+        def time_left() -> Optional[float]:
+            """Request timeout that ends by the deadline (0 once it has passed)"""
+            if stop_at is None:
+                return None
+            return max(0.0, min(self.timeout, stop_at - time.monotonic()))
+        
+        def find(article: Article) -> Tuple[Optional[str], Optional[ImageInfo]]:
+            # Queued lookups that only get a worker after the deadline are skipped
+            timeout = time_left()
+            if timeout == 0:
+                return article.image_url, None
+            return self._find_image(article, throttle, timeout)
+        
+        pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='images')
+        futures = {pool.submit(find, article): article for article in pending}
+        done, unresolved = wait(futures, timeout=deadline)
+        # Don't wait for lookups still in flight; their results are dropped
+        pool.shutdown(wait=False, cancel_futures=True)
+        
         images_found = 0
-        for article in articles:
-            if not article.get('image_url'):
-                image_url = self.extract_image(article)
-                if image_url:
-                    article['image_url'] = image_url
-                    images_found += 1
+        rejected = 0
+        sized = 0
+        for future in done:
+            article = futures[future]
+            image_url, info = future.result()
+            if article.image_url and image_url != article.image_url:
+                rejected += 1
+            elif image_url and not article.image_url:
+                images_found += 1
+            article.image_url = image_url
+            if info and info.width and info.height:
+                article.image_width = info.width
+                article.image_height = info.height
+                sized += 1
         
         logger.info(f"✓ Found images for {images_found}/{len(articles)} articles")
+        if self.probe:
+            logger.info(f"  Image sizes: {sized} read from headers; {self.probe.summary()}")
+            if rejected:
+                logger.info(f"  {rejected} feed images weren't images (replaced or dropped)")
+        if unresolved:
+            imageless = sum(1 for future in unresolved if not futures[future].image_url)
+            logger.warning(f"⚡ Image deadline ({deadline:.0f}s) reached: "
+                           f"{imageless} articles published without an image, "
+                           f"{len(unresolved) - imageless} without image dimensions")
         
         return articles
 
 
 def main():
-    """Test the image extractor"""
-    test_article = {
-        'title': 'Test Article',
-        'url': 'https://openai.com/blog/chatgpt',
-        'content': '<html><body><img src="/images/test.jpg" width="800" height="600"></body></html>'
-    }
+    """Test the image extractor (from pipeline/: python -m processing.image_extractor)"""
+    test_article = Article(
+        title='Test Article',
+        url='https://openai.com/blog/chatgpt',
+        published=None,
+        content='<html><body><img src="/images/test.jpg" width="800" height="600"></body></html>',
+        source='Test'
+    )
     
     extractor = ImageExtractor()
     image_url = extractor.extract_image(test_article)
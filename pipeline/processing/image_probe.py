@@ -0,0 +1,217 @@
+"""
+Image Header Probing
+Reads only the first bytes of an image to learn its real type and dimensions
+"""
+
+import logging
+import struct
+import threading
+from collections import namedtuple
+from contextlib import nullcontext
+from typing import Optional
+
+from ingestion.host_throttle import HostThrottle
+from ingestion.http_client import HTTPClient
+from ingestion.json_cache import JSONCache
+
+logger = logging.getLogger(__name__)
+
+# Enough for PNG, GIF and WebP headers and for most JPEG frame headers
+PROBE_BYTES = 16 * 1024
+
+# JPEGs with a large EXIF block (embedded thumbnail) put the frame header later
+JPEG_MAX_BYTES = 128 * 1024
+
+# JPEG start-of-frame markers (C4, C8 and CC are other segment types)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Real type and pixel size of an image; width and height are None when
+# the format was recognized but the size wasn't in the bytes read
+ImageInfo = namedtuple('ImageInfo', ['mime', 'width', 'height'])
+
+# Probe result for a URL that isn't an image, or that the server refuses
+NOT_AN_IMAGE = ImageInfo(None, None, None)
+
+
+def sniff_image(data: bytes) -> Optional[ImageInfo]:
+    """
+    Identify an image from its leading bytes
+    
+    Args:
+        data: Start of the image file
+    
+    Returns:
+        ImageInfo, or None if the bytes aren't a PNG, JPEG, GIF, WebP or SVG
+    """
+    if data.startswith(b'\x89PNG\r\n\x1a\n'):
+        if len(data) >= 24 and data[12:16] == b'IHDR':
+            width, height = struct.unpack('>II', data[16:24])
+            return ImageInfo('image/png', width, height)
+        return ImageInfo('image/png', None, None)
+    
+    if data[:6] in (b'GIF87a', b'GIF89a'):
+        if len(data) >= 10:
+            width, height = struct.unpack('<HH', data[6:10])
+            return ImageInfo('image/gif', width, height)
+        return ImageInfo('image/gif', None, None)
+    
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return _webp_info(data)
+    
+    if data[:2] == b'\xff\xd8':
+        return _jpeg_info(data)
+    
+    if b'<svg' in data[:1024].lower():
+        return ImageInfo('image/svg+xml', None, None)
+    
+    return None
+
+
+def _webp_info(data: bytes) -> ImageInfo:
+    """Size from the first WebP chunk (lossy, lossless or extended)"""
+    chunk = data[12:16]
+    try:
+        if chunk == b'VP8 ' and data[23:26] == b'\x9d\x01\x2a':
+            width, height = struct.unpack('<HH', data[26:30])
+            return ImageInfo('image/webp', width & 0x3FFF, height & 0x3FFF)
+        if chunk == b'VP8L' and data[20:21] == b'\x2f':
+            bits = struct.unpack('<I', data[21:25])[0]
+            return ImageInfo('image/webp', (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+        if chunk == b'VP8X':
+            width = int.from_bytes(data[24:27], 'little') + 1
+            height = int.from_bytes(data[27:30], 'little') + 1
+            return ImageInfo('image/webp', width, height)
+    except struct.error:
+        pass
+    return ImageInfo('image/webp', None, None)
+
+
+def _jpeg_info(data: bytes) -> ImageInfo:
+    """Size from the JPEG start-of-frame segment, walking segments from the start"""
+    position = 2
+    while position + 9 <= len(data):
+        if data[position] != 0xFF:
+            break
+        marker = data[position + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            position += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Markers without a length
+            position += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[position + 5:position + 9])
+            return ImageInfo('image/jpeg', width, height)
+        length = struct.unpack('>H', data[position + 2:position + 4])[0]
+        position += 2 + length
+    return ImageInfo('image/jpeg', None, None)
+
+
+class ImageProbe:
+    """
+    Learns image types and dimensions from partial reads
+    
+    Only the first PROBE_BYTES of an image are requested (a Range request,
+    with the read capped in case the server sends the whole file), which
+    is enough to parse PNG, GIF, WebP and most JPEG headers. JPEGs whose
+    frame header lies further in are read again up to JPEG_MAX_BYTES.
+    Results are cached per image URL, in a JSON file when cache_file is
+    given. URLs that aren't images, or that the server refuses (a 4xx
+    other than 429), are cached as such so they aren't requested again.
+    """
+    
+    def __init__(self, http_client: HTTPClient, cache_file: Optional[str] = None,
+                 ttl_hours: float = 720, max_entries: int = 5000, timeout: float = 10):
+        """
+        Args:
+            http_client: Shared HTTP client
+            cache_file: Path to the JSON cache file (None = keep results for this run only)
+            ttl_hours: How long a probe result is reused
+            max_entries: Images kept before the least recently used are evicted
+            timeout: Request timeout per image
+        """
+        self.http = http_client
+        self.cache = JSONCache(cache_file, ttl_hours=ttl_hours, max_entries=max_entries)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self.probes = 0
+        self.failures = 0
+        self.bytes_read = 0
+    
+    def probe(self, url: str, throttle: Optional[HostThrottle] = None,
+              timeout: Optional[float] = None) -> Optional[ImageInfo]:
+        """
+        Type and dimensions of an image
+        
+        Args:
+            url: Image URL
+            throttle: Per-host limits for the request (cached images don't wait on it)
+            timeout: Request timeout (None = the probe's default)
+        
+        Returns:
+            ImageInfo; NOT_AN_IMAGE if the URL isn't an image or the server
+            refused it (a 4xx other than 429); None if it couldn't be read
+            this time (timeouts, 429 and 5xx)
+        """
+        entry = self.cache.get(url)
+        if entry is not None:
+            # Replays don't use the cache, so they need the image recorded
+            self.http.reuse_recorded(url)
+            if not entry['mime']:
+                return NOT_AN_IMAGE
+            return ImageInfo(entry['mime'], entry['width'], entry['height'])
+        
+        try:
+            with throttle.slot(url) if throttle else nullcontext():
+                info, truncated = self._read(url, PROBE_BYTES, timeout)
+                if info and info.mime == 'image/jpeg' and info.width is None and truncated:
+                    info, _ = self._read(url, JPEG_MAX_BYTES, timeout)
+        except Exception as e:
+            logger.debug(f"Error probing image {url}: {e}")
+            with self._lock:
+                self.failures += 1
+            if not _is_broken(e):
+                # Timeouts and server errors may pass, so try again next run
+                return None
+            info = None
+        
+        info = info or NOT_AN_IMAGE
+        self.cache.put(url, info._asdict())
+        return info
+    
+    def save(self):
+        """Drop expired results and persist the cache to disk"""
+        self.cache.save()
+    
+    def summary(self) -> str:
+        """One-line summary of probes for the run log"""
+        return (f"{self.probes} probed ({self.bytes_read / 1024:.0f} KB read, "
+                f"{self.failures} failed), {self.cache.hits} from cache")
+    
+    def _read(self, url: str, max_bytes: int, timeout: Optional[float] = None):
+        """Read the start of an image and sniff it; returns (info, truncated)"""
+        headers = {
+            'Range': f'bytes=0-{max_bytes - 1}',
+            # Ranges apply to encoded bytes, so ask for them unencoded
+            'Accept-Encoding': 'identity'
+        }
+        with self._lock:
+            self.probes += 1
+        result = self.http.fetch(url, headers=headers, timeout=timeout or self.timeout,
+                                 max_bytes=max_bytes, chunk_size=PROBE_BYTES)
+        with self._lock:
+            self.bytes_read += result.bytes_read
+        
+        # Fewer bytes than asked for means the whole file was read
+        partial = result.truncated or len(result.content) >= max_bytes
+        return sniff_image(result.content), partial
+
+
+def _is_broken(error: Exception) -> bool:
+    """Whether a probe failure means the image is gone (4xx other than 429)"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return False
+    return 400 <= response.status_code < 500 and response.status_code != 429
@@ -10,6 +10,7 @@ Main orchestrator that runs the full pipeline:
 """
 
 import sys
+import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -17,6 +18,11 @@ import yaml
 import os
 from dotenv import load_dotenv
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
 # Load environment variables
 load_dotenv()
 
@@ -24,10 +30,22 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent))
 
 from ingestion.rss_fetcher import RSSFetcher, load_sources_from_yaml
+from ingestion.feed_cache import FeedCache
+from ingestion.http_client import HTTPClient
+from ingestion.response_store import ResponseStore
+from ingestion.watermarks import EntryWatermarks
+from ingestion.source_stats import SourceStats
+from ingestion.scheduler import PollScheduler
+from ingestion.circuit_breaker import CircuitBreaker
 from ingestion.html_fetcher import HTMLArticleFetcher
+from ingestion.extraction_plans import ExtractionPlans
+from ingestion.page_cache import PageCache
+from ingestion.page_fetcher import DEFAULT_HEAD_MAX_BYTES, PageFetcher
 from processing.deduplicator import process_articles
 from processing.history_filter import filter_by_history
 from processing.image_extractor import ImageExtractor
+from processing.image_probe import ImageProbe
+from processing.full_text import FullTextExtractor, TextCache
 from output.json_generator import ContentGenerator, assign_placeholder_scores
 
 # Configure logging
@@ -45,13 +63,83 @@ logger = logging.getLogger(__name__)
 class TechPulsePipeline:
     """Main pipeline orchestrator"""
     
-    def __init__(self, config_file: str = "config.yaml"):
-        """Initialize pipeline with configuration"""
+    def __init__(self, config_file: str = "config.yaml", replay_run: str = None):
+        """
+        Initialize pipeline with configuration
+        
+        Args:
+            config_file: Pipeline configuration file
+            replay_run: Recorded run ID to replay offline instead of fetching live
+        """
         self.config = self._load_config(config_file)
-        self.sources_file = Path(__file__).parent / "ingestion" / "sources.yaml"
+        # Relative state and recording paths are relative to pipeline/, not the CWD
+        pipeline_dir = Path(__file__).parent
+        self.sources_file = pipeline_dir / "ingestion" / "sources.yaml"
+        self.state_dir = pipeline_dir / self.config.get('state', {}).get('dir', 'state')
+        self.replay_run = replay_run
+        
+        recording_config = self.config.get('recording', {})
+        self.response_store = None
+        if replay_run:
+            self.response_store = ResponseStore(
+                pipeline_dir / recording_config.get('dir', 'state/responses'), replay_run, replay=True
+            )
+            # Keep replay output away from the live website content
+            replay_dir = pipeline_dir / recording_config.get('output_dir', 'state/replays') / replay_run
+            replay_dir.mkdir(parents=True, exist_ok=True)
+            self.config['output']['content_dir'] = str(replay_dir)
+        elif recording_config.get('enabled', True):
+            self.response_store = ResponseStore(pipeline_dir / recording_config.get('dir', 'state/responses'))
+        
+        # One pooled HTTP client for the whole run, so each host's
+        # connection handshake is paid once
+        self.http_client = HTTPClient.from_config(self.config.get('http', {}),
+                                                  response_store=self.response_store)
+        self.circuit_breaker = None
+        
+        # Article pages are read head-first by both the HTML scraper and
+        # the image extractor; a replay doesn't use the page cache so it
+        # sees exactly the recorded responses
+        ingestion_config = self.config.get('ingestion', {})
+        self.page_cache = None
+        if not replay_run and ingestion_config.get('page_cache', True):
+            self.page_cache = PageCache(
+                self.state_dir / 'page_cache.json',
+                ttl_hours=ingestion_config.get('page_cache_ttl_hours', 168),
+                max_entries=ingestion_config.get('page_cache_max_entries', 5000)
+            )
+        self.page_fetcher = PageFetcher(
+            self.http_client,
+            head_max_bytes=ingestion_config.get('page_head_max_bytes', DEFAULT_HEAD_MAX_BYTES),
+            page_cache=self.page_cache
+        )
+        
+        # Image dimensions for the output; a replay probes recorded
+        # responses without the cache
+        image_config = self.config.get('images', {})
+        self.image_probe = None
+        if image_config.get('probe_sizes', True):
+            self.image_probe = ImageProbe(
+                self.http_client,
+                cache_file=None if replay_run else self.state_dir / 'image_probe.json',
+                ttl_hours=image_config.get('probe_cache_ttl_hours', 720),
+                max_entries=image_config.get('probe_cache_max_entries', 5000)
+            )
+        
+        # Opt-in full-text stage; extracted text is cached between live runs
+        full_text_config = self.config.get('full_text', {})
+        self.text_cache = None
+        if not replay_run and full_text_config.get('enabled', False):
+            self.text_cache = TextCache(
+                self.state_dir / 'full_text_cache.json',
+                ttl_hours=full_text_config.get('cache_ttl_hours', 720),
+                max_entries=full_text_config.get('cache_max_entries', 1000)
+            )
         
         logger.info("="*60)
         logger.info("TechPulse Daily Curation Pipeline")
+        if replay_run:
+            logger.info(f"Replaying recorded run {replay_run} (no network access)")
         logger.info("="*60)
     
     def _load_config(self, config_file: str) -> dict:
@@ -71,6 +159,7 @@ class TechPulsePipeline:
             logger.info("\n📥 PHASE 1: Content Ingestion")
             logger.info("-" * 60)
             articles = self._ingest_content()
+            self._log_peak_memory("ingestion")
             
             if not articles:
                 logger.error("❌ No articles fetched! Exiting.")
@@ -93,6 +182,7 @@ class TechPulsePipeline:
             # Phase 4: Content Generation
             logger.info("\n📝 PHASE 4: Generating Content Files")
             logger.info("-" * 60)
+            articles = self._add_images(articles)
             self._generate_output(articles)
             
             # Summary
@@ -101,6 +191,10 @@ class TechPulsePipeline:
             logger.info("="*60)
             logger.info(f"Total articles published: {len(articles)}")
             logger.info(f"Content files generated in: {self.config['output']['content_dir']}")
+            logger.info(f"Article pages: {self.page_fetcher.summary()}")
+            if self.page_cache:
+                logger.info(f"Page cache: {self.page_cache.summary()}")
+            self._log_tripped_breakers()
             logger.info("")
             
             return True
@@ -108,6 +202,13 @@ class TechPulsePipeline:
         except Exception as e:
             logger.error(f"❌ Pipeline failed: {e}", exc_info=True)
             return False
+        
+        finally:
+            self.http_client.close()
+            self._save_recording()
+            self._save_page_cache()
+            self._save_text_cache()
+            self._save_image_probe()
     
     def _ingest_content(self) -> list:
         """Fetch articles from all configured sources"""
@@ -120,34 +221,171 @@ class TechPulsePipeline:
         logger.info(f"Loading from {len(rss_sources)} RSS sources and {len(html_sources)} HTML sources...")
         
         lookback_hours = self.config['pipeline']['lookback_hours']
+        ingestion_config = self.config.get('ingestion', {})
         all_articles = []
         
+        # A replay neither reads nor updates the caches and statistics kept
+        # between live runs, so it sees exactly the recorded responses
+        live = self.replay_run is None
+        if not live:
+            lookback_hours += self._hours_since_recording()
+        
         # Fetch RSS articles
         if rss_sources:
-            rss_fetcher = RSSFetcher(timeout=30, max_retries=3)
-            rss_articles = rss_fetcher.fetch_all_sources(rss_sources, lookback_hours=lookback_hours)
+            feed_cache = None
+            if live and ingestion_config.get('conditional_get', True):
+                feed_cache = FeedCache(self.state_dir / 'feed_cache.json')
+            
+            watermarks = None
+            if live and ingestion_config.get('watermarks', True):
+                watermarks = EntryWatermarks(self.state_dir / 'watermarks.json')
+            
+            source_stats = None
+            if live:
+                source_stats = SourceStats(self.state_dir / 'source_stats.json')
+                self.circuit_breaker = CircuitBreaker(
+                    source_stats,
+                    failure_threshold=ingestion_config.get('breaker_threshold', 3),
+                    cooldown_hours=ingestion_config.get('breaker_cooldown_hours', 6)
+                )
+            
+            # Skipped sources are served from stored entries, so adaptive
+            # polling needs watermarks
+            scheduler = None
+            if ingestion_config.get('adaptive_polling', True) and watermarks:
+                scheduler = PollScheduler(
+                    source_stats,
+                    max_interval_hours=ingestion_config.get('max_poll_interval_hours', 24)
+                )
+            
+            rss_fetcher = RSSFetcher(
+                timeout=30,
+                max_retries=ingestion_config.get('max_retries', 2),
+                feed_cache=feed_cache,
+                http_client=self.http_client,
+                watermarks=watermarks,
+                parse_workers=ingestion_config.get('parse_workers', 0),
+                max_feed_bytes=ingestion_config.get('max_feed_bytes', 5_000_000),
+                source_stats=source_stats,
+                scheduler=scheduler,
+                circuit_breaker=self.circuit_breaker
+            )
+            rss_articles = rss_fetcher.fetch_all_sources(
+                rss_sources,
+                lookback_hours=lookback_hours,
+                max_workers=ingestion_config.get('max_workers', 8),
+                per_host_limit=ingestion_config.get('per_host_limit', 1),
+                host_delay=ingestion_config.get('host_delay', 1.0) if live else 0
+            )
             all_articles.extend(rss_articles)
             logger.info(f"✓ Fetched {len(rss_articles)} articles from RSS sources")
         
         # Fetch HTML articles
         if html_sources:
-            html_fetcher = HTMLArticleFetcher(timeout=30)
-            for source in html_sources:
-                html_articles = html_fetcher.fetch_from_sitemap(
-                    sitemap_url=source['sitemap_url'],
-                    url_pattern=source['url_pattern'],
-                    source_name=source['name'],
-                    category=source.get('category', 'general'),
-                    lookback_hours=lookback_hours,
-                    max_articles=30  # Limit per HTML source
-                )
-                all_articles.extend(html_articles)
-            logger.info(f"✓ Fetched {len([a for a in all_articles if a not in rss_articles])} articles from HTML sources")
+            seen_urls = None
+            if live and ingestion_config.get('html_seen_urls', True):
+                seen_urls = EntryWatermarks(self.state_dir / 'html_seen.json')
+            
+            plans = None
+            if live and ingestion_config.get('extraction_plans', True):
+                plans = ExtractionPlans(self.state_dir / 'extraction_plans.json')
+            
+            html_fetcher = HTMLArticleFetcher(timeout=30, http_client=self.http_client,
+                                              seen_urls=seen_urls,
+                                              page_fetcher=self.page_fetcher,
+                                              plans=plans)
+            html_articles = html_fetcher.fetch_all_sources(
+                html_sources,
+                lookback_hours=lookback_hours,
+                max_articles=30,  # Limit per HTML source
+                max_workers=ingestion_config.get('html_max_workers', 8),
+                per_host_limit=ingestion_config.get('html_per_host_limit', 4),
+                host_delay=ingestion_config.get('html_host_delay', 0.25) if live else 0
+            )
+            all_articles.extend(html_articles)
+            logger.info(f"✓ Fetched {len(html_articles)} articles from HTML sources")
         
         logger.info(f"✓ Ingested {len(all_articles)} total articles")
         
         return all_articles
     
+    def _hours_since_recording(self) -> float:
+        """Age of the replayed run, so its lookback window covers the same articles"""
+        started = self.response_store.started
+        if not started:
+            return 0
+        return max(0.0, (datetime.now() - started).total_seconds() / 3600)
+    
+    def _save_recording(self):
+        """Write the run's response manifest and drop old recordings"""
+        if not self.response_store or self.response_store.replay:
+            return
+        
+        try:
+            self.response_store.save()
+            self.response_store.prune(self.config.get('recording', {}).get('keep_runs', 14))
+        except OSError as e:
+            logger.warning(f"Could not save recorded responses: {e}")
+    
+    def _save_page_cache(self):
+        """Persist page metadata for later runs"""
+        if not self.page_cache:
+            return
+        
+        try:
+            self.page_cache.save()
+        except OSError as e:
+            logger.warning(f"Could not save page cache: {e}")
+    
+    def _save_text_cache(self):
+        """Persist extracted article text for later runs"""
+        if not self.text_cache:
+            return
+        
+        try:
+            self.text_cache.save()
+        except OSError as e:
+            logger.warning(f"Could not save full-text cache: {e}")
+    
+    def _save_image_probe(self):
+        """Persist probed image dimensions for later runs"""
+        if not self.image_probe:
+            return
+        
+        try:
+            self.image_probe.save()
+        except OSError as e:
+            logger.warning(f"Could not save image probe cache: {e}")
+    
+    def _log_tripped_breakers(self):
+        """List sources currently skipped by their circuit breaker"""
+        if not self.circuit_breaker:
+            return
+        
+        tripped = self.circuit_breaker.tripped()
+        if not tripped:
+            return
+        
+        logger.info(f"⚡ Circuit breakers open: {len(tripped)}")
+        for source_name, failures, retry_at in tripped:
+            logger.info(f"  - {source_name}: {failures} consecutive failures, "
+                        f"next attempt {retry_at:%Y-%m-%d %H:%M}")
+    
+    def _log_peak_memory(self, phase: str):
+        """Log peak resident memory so far (this process and parse workers)"""
+        if resource is None:
+            return
+        
+        # ru_maxrss is kilobytes on Linux but bytes on macOS
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        main_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+        workers_mb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+        
+        message = f"  Peak memory after {phase}: {main_mb:.0f} MB"
+        if workers_mb:
+            message += f" (largest parse worker: {workers_mb:.0f} MB)"
+        logger.info(message)
+    
     def _load_all_sources(self, yaml_file: str) -> dict:
         """Load both RSS and HTML sources from YAML file"""
         with open(yaml_file, 'r') as f:
@@ -170,7 +408,7 @@ class TechPulsePipeline:
         }
     
     def _process_content(self, articles: list) -> list:
-        """Deduplicate, filter, and enrich articles"""
+        """Deduplicate, filter, and (optionally) expand articles to full text"""
         
         min_words = self.config['pipeline']['min_word_count']
         
@@ -192,16 +430,20 @@ class TechPulsePipeline:
         
         logger.info(f"✓ {len(articles)} articles after history filter")
         
-        # Extract images from articles
-        logger.info("Extracting images from articles...")
-        extractor = ImageExtractor()
-        article_dicts = [self._article_to_dict(a) for a in articles]
-        enriched_dicts = extractor.add_images_to_articles(article_dicts)
-        
-        # Update articles with image URLs
-        for article, enriched in zip(articles, enriched_dicts):
-            if enriched.get('image_url'):
-                article.image_url = enriched['image_url']
+        # Full article text for the most promising candidates (opt-in)
+        full_text_config = self.config.get('full_text', {})
+        if full_text_config.get('enabled', False):
+            # A replay reads recorded responses, so there's no host to space out
+            live = self.replay_run is None
+            extractor = FullTextExtractor(
+                self.page_fetcher,
+                text_cache=self.text_cache,
+                top_n=full_text_config.get('top_n', 60),
+                max_workers=full_text_config.get('max_workers', 4),
+                per_host_limit=full_text_config.get('per_host_limit', 2),
+                host_delay=full_text_config.get('host_delay', 0.25) if live else 0
+            )
+            articles = extractor.add_full_text(articles)
         
         return articles
     
@@ -219,18 +461,8 @@ class TechPulsePipeline:
                 # Initialize AI scorer
                 scorer = AIScorer()
                 
-                # Convert articles to dicts for scoring
-                article_dicts = [self._article_to_dict(a) for a in articles]
-                
-                # Score with AI
-                scored_dicts = scorer.score_articles(article_dicts)
-                
-                # Update article objects with AI scores and categories
-                # Note: image_url already set during enrichment phase, don't overwrite
-                for article, scored_dict in zip(articles, scored_dicts):
-                    article.score = scored_dict.get('ai_score', 5.0)
-                    if scored_dict.get('ai_category'):
-                        article.category = scored_dict['ai_category']
+                # Score with AI (sets score and category on each article)
+                articles = scorer.score_articles(articles)
                 
             except Exception as e:
                 logger.error(f"AI scoring failed: {e}")
@@ -268,23 +500,27 @@ class TechPulsePipeline:
         
         return articles
     
-    def _article_to_dict(self, article) -> dict:
-        """Convert Article object to dictionary for AI scoring"""
-        # Extract summary from content (first 300 chars)
-        summary = article.content[:300] if article.content else ""
-        
-        return {
-            'title': article.title,
-            'url': article.url,
-            'summary': summary,
-            'content': article.content,
-            'source': article.source,
-            'category': article.category,
-            'published': article.published,
-            'author': getattr(article, 'author', None),
-            'word_count': len(article.content.split()) if article.content else 0,
-            'image_url': getattr(article, 'image_url', None)
-        }
+    def _add_images(self, articles: list) -> list:
+        """
+        Resolve images for the selected articles only
+        
+        Runs after scoring and selection, so pages are never fetched for
+        articles that don't make it into the output. Scoring only sees
+        the image hints feeds provide (media:content, enclosures...).
+        """
+        image_config = self.config.get('images', {})
+        # A replay reads recorded responses, so there's no host to space out
+        live = self.replay_run is None
+        extractor = ImageExtractor(http_client=self.http_client,
+                                   page_fetcher=self.page_fetcher,
+                                   image_probe=self.image_probe)
+        return extractor.add_images_to_articles(
+            articles,
+            max_workers=image_config.get('max_workers', 8),
+            per_host_limit=image_config.get('per_host_limit', 2),
+            host_delay=image_config.get('host_delay', 0.25) if live else 0,
+            deadline=image_config.get('deadline_seconds', 60)
+        )
     
     def _generate_output(self, articles: list):
         """Generate JSON output files"""
@@ -308,12 +544,23 @@ class TechPulsePipeline:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="TechPulse daily content curation pipeline")
+    parser.add_argument('--replay', metavar='RUN_ID',
+                        help="Re-run offline from a recorded run's responses")
+    args = parser.parse_args()
     
     # Run the pipeline
-    pipeline = TechPulsePipeline()
+    try:
+        pipeline = TechPulsePipeline(replay_run=args.replay)
+    except FileNotFoundError as e:
+        print(f"\n❌ {e}")
+        sys.exit(1)
     success = pipeline.run()
     
-    if success:
+    if success and args.replay:
+        print(f"\n🎉 Replay finished. Output written to {pipeline.config['output']['content_dir']}")
+        sys.exit(0)
+    elif success:
         print("\n🎉 Success! Check the 'content' directory for generated files.")
         print("\n📋 Next steps:")
         print("  1. Review content/latest.json")
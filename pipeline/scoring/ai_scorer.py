@@ -7,13 +7,17 @@ Uses OpenAI embeddings to match articles against your taste profile
 import os
 import yaml
 import logging
-from typing import List, Dict, Optional
+from typing import List, Optional
 from pathlib import Path
+from datetime import datetime
 import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 from openai import OpenAI
 from dotenv import load_dotenv
 
+from ingestion.rss_fetcher import Article
+from scoring.signals import score_recency, score_source_trust
+
 # Load environment variables
 load_dotenv()
 
@@ -134,12 +138,12 @@ class AIScorer:
             logger.error(f"Error getting embedding: {e}")
             return np.zeros(1536)
     
-    def score_article(self, article: Dict) -> tuple:
+    def score_article(self, article: Article) -> tuple:
         """
         Score a single article based on taste profile
         
         Args:
-            article: Article dictionary with title, summary, source, etc.
+            article: Article to score
             
         Returns:
             Tuple of (score, best_matching_category)
@@ -154,13 +158,13 @@ class AIScorer:
         topic_score, best_category = self._calculate_topic_relevance(article_embedding, return_category=True)
         
         # Calculate source trust score
-        source_score = self._calculate_source_trust(article.get('source', ''))
+        source_score = self._calculate_source_trust(article.source or '')
         
         # Calculate content quality score
         quality_score = self._calculate_content_quality(article)
         
         # Calculate recency score
-        recency_score = self._calculate_recency_score(article.get('published'))
+        recency_score = self._calculate_recency_score(article.published)
         
         # Calculate uniqueness score (for now, placeholder)
         uniqueness_score = 0.7
@@ -180,18 +184,18 @@ class AIScorer:
         
         return round(final_score, 1), best_category
     
-    def _build_article_text(self, article: Dict) -> str:
+    def _build_article_text(self, article: Article) -> str:
         """Build comprehensive text representation of article"""
         parts = []
         
-        if article.get('title'):
-            parts.append(f"Title: {article['title']}")
+        if article.title:
+            parts.append(f"Title: {article.title}")
         
-        if article.get('summary'):
-            parts.append(f"Summary: {article['summary']}")
+        if article.summary:
+            parts.append(f"Summary: {article.summary}")
         
-        if article.get('category'):
-            parts.append(f"Category: {article['category']}")
+        if article.category:
+            parts.append(f"Category: {article.category}")
         
         return " | ".join(parts)
     
@@ -232,126 +236,86 @@ class AIScorer:
     
     def _calculate_source_trust(self, source: str) -> float:
         """Calculate source trust score"""
-        source_weights = self.profile.get('source_weights', {})
-        
-        # Find matching source
-        for source_name, weight in source_weights.items():
-            if source_name.lower() in source.lower():
-                # Scale weight to 0-1 range (assuming weights are 0.5-1.2)
-                return (weight - 0.5) / 0.7
-        
-        # Default for unknown sources
-        return 0.5
+        return score_source_trust(source, self.profile.get('source_weights', {}))
     
-    def _calculate_content_quality(self, article: Dict) -> float:
+    def _calculate_content_quality(self, article: Article) -> float:
         """Calculate content quality score"""
         score = 0.5  # Base score
         
         # Has substantial summary?
-        summary = article.get('summary', '')
+        summary = article.summary
         if len(summary) > 200:
             score += 0.2
         elif len(summary) > 100:
             score += 0.1
         
         # Has good word count?
-        word_count = article.get('word_count', 0)
+        word_count = article.word_count
         if word_count > 1000:
             score += 0.2
         elif word_count > 500:
             score += 0.1
         
         # Has author?
-        if article.get('author'):
+        if article.author:
             score += 0.05
         
-        # Has image?
-        if article.get('image_url'):
+        # Has image? Only the feed's image hint is known at this point;
+        # page images are resolved after selection
+        if article.image_url:
             score += 0.05
         
         return min(1.0, score)
     
     def _calculate_recency_score(self, published_date) -> float:
         """Calculate recency score - newer is better"""
-        if not published_date:
-            return 0.5
-        
-        from datetime import datetime, timedelta
-        
-        try:
-            if isinstance(published_date, str):
-                # Try parsing ISO format
-                pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-            else:
-                pub_date = published_date
-            
-            now = datetime.now(pub_date.tzinfo)
-            age_hours = (now - pub_date).total_seconds() / 3600
-            
-            # Score based on age
-            if age_hours < 6:
-                return 1.0  # Very recent
-            elif age_hours < 24:
-                return 0.9  # Today
-            elif age_hours < 48:
-                return 0.7  # Yesterday
-            elif age_hours < 168:  # 1 week
-                return 0.5
-            else:
-                return 0.3  # Older
-                
-        except Exception as e:
-            logger.debug(f"Error calculating recency: {e}")
-            return 0.5
+        return score_recency(published_date)
     
-    def score_articles(self, articles: List[Dict]) -> List[Dict]:
+    def score_articles(self, articles: List[Article]) -> List[Article]:
         """
-        Score multiple articles and add scores to them
+        Score multiple articles in place
         
         Args:
-            articles: List of article dictionaries
+            articles: List of Article objects
             
         Returns:
-            Articles with 'ai_score' and 'ai_category' added
+            The same articles with score and (AI-assigned) category set
         """
         logger.info(f"Scoring {len(articles)} articles with AI...")
         
-        scored_articles = []
         for article in articles:
             try:
                 score, category = self.score_article(article)
-                article['ai_score'] = score
-                article['ai_category'] = category
-                scored_articles.append(article)
+                article.score = score
+                if category:
+                    article.category = category
                 
             except Exception as e:
-                logger.error(f"Error scoring article '{article.get('title', 'Unknown')}': {e}")
-                article['ai_score'] = 5.0  # Default score
-                article['ai_category'] = "General"
-                scored_articles.append(article)
+                logger.error(f"Error scoring article '{article.title or 'Unknown'}': {e}")
+                article.score = 5.0  # Default score
+                article.category = "General"
         
-        # Don't sort here - maintain original order to preserve article-image mapping
-        # Articles will be sorted by score in the JSON generator
+        # Don't sort here - articles are sorted by score after scoring
         
-        logger.info(f"✓ Scored articles: {len(scored_articles)} total")
-        if scored_articles:
-            scores = [a.get('ai_score', 0) for a in scored_articles]
+        logger.info(f"✓ Scored articles: {len(articles)} total")
+        if articles:
+            scores = [a.score or 0 for a in articles]
             logger.info(f"  Score range: {min(scores):.1f} - {max(scores):.1f} (avg: {sum(scores)/len(scores):.1f})")
         
-        return scored_articles
+        return articles
 
 
 def main():
     """Test the AI scorer"""
     # Test article
-    test_article = {
-        'title': 'New GPT-5 Model Released with Breakthrough Benchmarks',
-        'summary': 'OpenAI releases GPT-5 with significant improvements in reasoning and coding capabilities. Achieves 95% on HumanEval and shows strong performance on enterprise use cases.',
-        'source': 'OpenAI Blog',
-        'category': 'AI News',
-        'published': '2024-11-26T10:00:00Z',
-        'word_count': 1200
-    }
+    test_article = Article(
+        title='New GPT-5 Model Released with Breakthrough Benchmarks',
+        url='https://openai.com/blog/gpt-5',
+        published=datetime.fromisoformat('2024-11-26T10:00:00+00:00'),
+        content='OpenAI releases GPT-5 with significant improvements in reasoning and coding capabilities. Achieves 95% on HumanEval and shows strong performance on enterprise use cases.',
+        source='OpenAI Blog',
+        category='AI News'
+    )
     
     # Initialize scorer
     scorer = AIScorer()
@@ -360,7 +324,7 @@ def main():
     score = scorer.score_article(test_article)
     
     print(f"\n{'='*60}")
-    print(f"Article: {test_article['title']}")
+    print(f"Article: {test_article.title}")
     print(f"Score: {score}/10")
     print(f"{'='*60}\n")
 
@@ -0,0 +1,70 @@
+"""
+Cheap Scoring Signals
+Source trust and recency, shared by the AI scorer and the full-text pre-rank
+"""
+
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def score_source_trust(source: str, source_weights: dict) -> float:
+    """
+    Source trust score from the taste profile's source weights
+    
+    Args:
+        source: Article source name
+        source_weights: Source name -> weight, as in taste_profile.yaml
+    
+    Returns:
+        Score from 0 to 1 (0.5 for unknown sources)
+    """
+    # Find matching source
+    for source_name, weight in source_weights.items():
+        if source_name.lower() in source.lower():
+            # Scale weight to 0-1 range (assuming weights are 0.5-1.2)
+            return (weight - 0.5) / 0.7
+    
+    # Default for unknown sources
+    return 0.5
+
+
+def score_recency(published_date) -> float:
+    """
+    Recency score - newer is better
+    
+    Args:
+        published_date: Publication datetime or ISO string (None if unknown)
+    
+    Returns:
+        Score from 0.3 to 1 (0.5 when the date is unknown)
+    """
+    if not published_date:
+        return 0.5
+    
+    try:
+        if isinstance(published_date, str):
+            # Try parsing ISO format
+            pub_date = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
+        else:
+            pub_date = published_date
+        
+        now = datetime.now(pub_date.tzinfo)
+        age_hours = (now - pub_date).total_seconds() / 3600
+        
+        # Score based on age
+        if age_hours < 6:
+            return 1.0  # Very recent
+        elif age_hours < 24:
+            return 0.9  # Today
+        elif age_hours < 48:
+            return 0.7  # Yesterday
+        elif age_hours < 168:  # 1 week
+            return 0.5
+        else:
+            return 0.3  # Older
+            
+    except Exception as e:
+        logger.debug(f"Error calculating recency: {e}")
+        return 0.5